@@ -0,0 +1,67 @@
+"""add composite user/time indexes on snapshot tables
+
+Revision ID: 20260831_01
+Revises: 20260327_01
+Create Date: 2026-08-31 09:00:00.000000
+
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20260831_01"
+down_revision: Union[str, Sequence[str], None] = "20260327_01"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COMPOSITE_INDEXES: tuple[tuple[str, str, tuple[str, ...]], ...] = (
+	(
+		"ix_portfoliosnapshot_user_created",
+		"portfoliosnapshot",
+		("user_id", "created_at"),
+	),
+	(
+		"ix_holdingperformancesnapshot_user_scope_symbol_created",
+		"holdingperformancesnapshot",
+		("user_id", "scope", "symbol", "created_at"),
+	),
+	(
+		"ix_realtimeportfoliosnapshot_user_created",
+		"realtimeportfoliosnapshot",
+		("user_id", "created_at"),
+	),
+	(
+		"ix_realtimeholdingperformancesnapshot_user_scope_symbol_created",
+		"realtimeholdingperformancesnapshot",
+		("user_id", "scope", "symbol", "created_at"),
+	),
+)
+
+
+def _index_names(inspector: sa.Inspector, table_name: str) -> set[str]:
+	return {index["name"] for index in inspector.get_indexes(table_name)}
+
+
+def upgrade() -> None:
+	bind = op.get_bind()
+	inspector = sa.inspect(bind)
+
+	for index_name, table_name, column_names in COMPOSITE_INDEXES:
+		if index_name in _index_names(inspector, table_name):
+			continue
+		op.create_index(index_name, table_name, list(column_names), unique=False)
+
+
+def downgrade() -> None:
+	bind = op.get_bind()
+	inspector = sa.inspect(bind)
+
+	for index_name, table_name, _column_names in reversed(COMPOSITE_INDEXES):
+		if index_name not in _index_names(inspector, table_name):
+			continue
+		op.drop_index(index_name, table_name=table_name)
@@ -0,0 +1,51 @@
+"""drop single-column created_at indexes superseded by composite indexes
+
+Revision ID: 20260831_02
+Revises: 20260831_01
+Create Date: 2026-08-31 09:30:00.000000
+
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20260831_02"
+down_revision: Union[str, Sequence[str], None] = "20260831_01"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+REDUNDANT_INDEXES: tuple[tuple[str, str], ...] = (
+	("ix_portfoliosnapshot_created_at", "portfoliosnapshot"),
+	("ix_holdingperformancesnapshot_created_at", "holdingperformancesnapshot"),
+	("ix_realtimeportfoliosnapshot_created_at", "realtimeportfoliosnapshot"),
+	("ix_realtimeholdingperformancesnapshot_created_at", "realtimeholdingperformancesnapshot"),
+)
+
+
+def _index_names(inspector: sa.Inspector, table_name: str) -> set[str]:
+	return {index["name"] for index in inspector.get_indexes(table_name)}
+
+
+def upgrade() -> None:
+	bind = op.get_bind()
+	inspector = sa.inspect(bind)
+
+	for index_name, table_name in REDUNDANT_INDEXES:
+		if index_name not in _index_names(inspector, table_name):
+			continue
+		op.drop_index(index_name, table_name=table_name)
+
+
+def downgrade() -> None:
+	bind = op.get_bind()
+	inspector = sa.inspect(bind)
+
+	for index_name, table_name in reversed(REDUNDANT_INDEXES):
+		if index_name in _index_names(inspector, table_name):
+			continue
+		op.create_index(index_name, table_name, ["created_at"], unique=False)
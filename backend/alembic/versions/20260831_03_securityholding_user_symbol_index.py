@@ -0,0 +1,57 @@
+"""replace per-column securityholding indexes with a (user_id, symbol) composite
+
+Revision ID: 20260831_03
+Revises: 20260831_02
+Create Date: 2026-08-31 10:00:00.000000
+
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20260831_03"
+down_revision: Union[str, Sequence[str], None] = "20260831_02"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COMPOSITE_INDEX = ("ix_securityholding_user_symbol", ("user_id", "symbol"))
+REPLACED_INDEXES: tuple[tuple[str, tuple[str, ...]], ...] = (
+	("ix_securityholding_user_id", ("user_id",)),
+	("ix_securityholding_symbol", ("symbol",)),
+)
+TABLE_NAME = "securityholding"
+
+
+def _index_names(inspector: sa.Inspector) -> set[str]:
+	return {index["name"] for index in inspector.get_indexes(TABLE_NAME)}
+
+
+def upgrade() -> None:
+	bind = op.get_bind()
+	existing = _index_names(sa.inspect(bind))
+
+	composite_name, composite_columns = COMPOSITE_INDEX
+	if composite_name not in existing:
+		op.create_index(composite_name, TABLE_NAME, list(composite_columns), unique=False)
+
+	for index_name, _column_names in REPLACED_INDEXES:
+		if index_name in existing:
+			op.drop_index(index_name, table_name=TABLE_NAME)
+
+
+def downgrade() -> None:
+	bind = op.get_bind()
+	existing = _index_names(sa.inspect(bind))
+
+	for index_name, column_names in REPLACED_INDEXES:
+		if index_name not in existing:
+			op.create_index(index_name, TABLE_NAME, list(column_names), unique=False)
+
+	composite_name, _composite_columns = COMPOSITE_INDEX
+	if composite_name in existing:
+		op.drop_index(composite_name, table_name=TABLE_NAME)
@@ -0,0 +1,127 @@
+"""add portfolio snapshot rollup table for dashboard timelines
+
+Revision ID: 20260831_04
+Revises: 20260831_03
+Create Date: 2026-08-31 12:00:00.000000
+
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Sequence, Union
+from zoneinfo import ZoneInfo
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20260831_04"
+down_revision: Union[str, Sequence[str], None] = "20260831_03"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE_NAME = "portfoliosnapshotrollup"
+INDEX_NAME = "ix_portfoliosnapshotrollup_user_granularity_bucket"
+# Bucket boundaries follow the dashboard display timezone, matching
+# app.analytics.bucket_start_utc.
+DISPLAY_TIMEZONE = ZoneInfo("Asia/Shanghai")
+
+
+def _table_names(inspector: sa.Inspector) -> set[str]:
+	return set(inspector.get_table_names())
+
+
+def _bucket_start_utc(timestamp: datetime, granularity: str) -> datetime:
+	if timestamp.tzinfo is None:
+		timestamp = timestamp.replace(tzinfo=timezone.utc)
+	local_timestamp = timestamp.astimezone(DISPLAY_TIMEZONE)
+	if granularity == "day":
+		bucket_start_local = local_timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+	else:
+		bucket_start_local = local_timestamp.replace(
+			day=1,
+			hour=0,
+			minute=0,
+			second=0,
+			microsecond=0,
+		)
+	return bucket_start_local.astimezone(timezone.utc)
+
+
+def _backfill_rollups(bind: sa.Connection) -> None:
+	snapshot_rows = bind.execute(
+		sa.text(
+			"SELECT user_id, total_value_cny, created_at FROM portfoliosnapshot "
+			"ORDER BY user_id, created_at",
+		),
+	).all()
+	if not snapshot_rows:
+		return
+
+	# Rows arrive ordered by created_at, so the last write per bucket wins —
+	# the same "latest snapshot in bucket" rule the dashboard applies.
+	rollups: dict[tuple[str, str, datetime], object] = {}
+	for user_id, total_value_cny, created_at in snapshot_rows:
+		for granularity in ("day", "month"):
+			bucket = _bucket_start_utc(created_at, granularity)
+			rollups[(user_id, granularity, bucket)] = total_value_cny
+
+	now = datetime.now(timezone.utc)
+	bind.execute(
+		sa.text(
+			f"INSERT INTO {TABLE_NAME} "
+			"(user_id, granularity, bucket_start_utc, total_value_cny, updated_at) "
+			"VALUES (:user_id, :granularity, :bucket_start_utc, :total_value_cny, :updated_at)",
+		),
+		[
+			{
+				"user_id": user_id,
+				"granularity": granularity,
+				"bucket_start_utc": bucket,
+				"total_value_cny": total_value_cny,
+				"updated_at": now,
+			}
+			for (user_id, granularity, bucket), total_value_cny in rollups.items()
+		],
+	)
+
+
+def upgrade() -> None:
+	bind = op.get_bind()
+	inspector = sa.inspect(bind)
+	if TABLE_NAME in _table_names(inspector):
+		return
+
+	op.create_table(
+		TABLE_NAME,
+		sa.Column("id", sa.Integer(), nullable=False),
+		sa.Column("user_id", sa.String(length=32), nullable=False),
+		sa.Column("granularity", sa.String(length=8), nullable=False),
+		sa.Column("bucket_start_utc", sa.DateTime(timezone=True), nullable=False),
+		sa.Column(
+			"total_value_cny",
+			sa.Numeric(precision=24, scale=8, asdecimal=True),
+			nullable=False,
+			server_default="0",
+		),
+		sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+		sa.PrimaryKeyConstraint("id"),
+	)
+	op.create_index(
+		INDEX_NAME,
+		TABLE_NAME,
+		["user_id", "granularity", "bucket_start_utc"],
+		unique=True,
+	)
+	_backfill_rollups(bind)
+
+
+def downgrade() -> None:
+	bind = op.get_bind()
+	inspector = sa.inspect(bind)
+	if TABLE_NAME not in _table_names(inspector):
+		return
+
+	op.drop_index(INDEX_NAME, table_name=TABLE_NAME)
+	op.drop_table(TABLE_NAME)
@@ -6,7 +6,7 @@ from zoneinfo import ZoneInfo
 
 from app.fixed_precision import decimal_to_float, display_money, display_percent
 from app.models import HoldingPerformanceSnapshot, PortfolioSnapshot
-from app.schemas import TimelinePoint
+from app.schemas import TIMELINE_POINT_LIST_ADAPTER, TimelinePoint
 
 SeriesSnapshot = TypeVar("SeriesSnapshot")
 DISPLAY_TIMEZONE = ZoneInfo("Asia/Shanghai")
@@ -77,31 +77,30 @@ def _build_timeline_from_snapshots(
 	get_value: Callable[[SeriesSnapshot], float],
 	format_value: Callable[[float], float],
 ) -> list[TimelinePoint]:
-	buckets: dict[datetime, SeriesSnapshot] = {}
+	# Keep the coerced timestamp alongside each incumbent so collisions do not
+	# re-derive it from the snapshot on every comparison.
+	buckets: dict[datetime, tuple[datetime, SeriesSnapshot]] = {}
 	for snapshot in snapshots:
 		snapshot_created_at = _coerce_utc_datetime(get_created_at(snapshot))
 		bucket_utc = bucket_start_utc(snapshot_created_at, granularity)
 		current = buckets.get(bucket_utc)
-		current_created_at = (
-			_coerce_utc_datetime(get_created_at(current)) if current is not None else None
-		)
-		if current is None or (
-			current_created_at is not None and snapshot_created_at >= current_created_at
-		):
-			buckets[bucket_utc] = snapshot
-
-	return [
-		TimelinePoint(
-			label=_bucket_label(bucket_utc, granularity),
-			value=format_value(get_value(snapshot)),
-			timestamp_utc=bucket_utc,
-			corrected=False,
-		)
-		for bucket_utc, snapshot in sorted(
-			buckets.items(),
-			key=lambda item: item[0],
-		)
-	]
+		if current is None or snapshot_created_at >= current[0]:
+			buckets[bucket_utc] = (snapshot_created_at, snapshot)
+
+	return TIMELINE_POINT_LIST_ADAPTER.validate_python(
+		[
+			{
+				"label": _bucket_label(bucket_utc, granularity),
+				"value": format_value(get_value(snapshot)),
+				"timestamp_utc": bucket_utc,
+				"corrected": False,
+			}
+			for bucket_utc, (_snapshot_created_at, snapshot) in sorted(
+				buckets.items(),
+				key=lambda item: item[0],
+			)
+		],
+	)
 
 
 def build_timeline(
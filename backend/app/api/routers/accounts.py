@@ -10,6 +10,7 @@ from app.schemas import (
 from app.services.asset_record_service import list_asset_records
 from app.services.portfolio_service import (
 	create_account,
+	create_accounts_bulk,
 	create_cash_ledger_adjustment,
 	delete_account,
 	delete_cash_ledger_adjustment,
@@ -24,6 +25,13 @@ router = APIRouter()
 
 router.add_api_route("/api/accounts", list_accounts, methods=["GET"], response_model=list[CashAccountRead])
 router.add_api_route("/api/accounts", create_account, methods=["POST"], response_model=CashAccountRead, status_code=201)
+router.add_api_route(
+	"/api/accounts/bulk",
+	create_accounts_bulk,
+	methods=["POST"],
+	response_model=list[CashAccountRead],
+	status_code=201,
+)
 router.add_api_route("/api/accounts/{account_id}", update_account, methods=["PUT"], response_model=CashAccountRead)
 router.add_api_route("/api/accounts/{account_id}", delete_account, methods=["DELETE"], status_code=204)
 router.add_api_route(
@@ -6,7 +6,7 @@ from typing import Any
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response
+from fastapi.responses import ORJSONResponse, Response
 from starlette.middleware.sessions import SessionMiddleware
 from starlette.middleware.trustedhost import TrustedHostMiddleware
 
@@ -43,7 +43,7 @@ async def lifespan(_: FastAPI):
 	try:
 		yield
 	finally:
-		pass
+		await market_data_client.aclose()
 
 
 def create_app() -> FastAPI:
@@ -51,6 +51,9 @@ def create_app() -> FastAPI:
 		title="OpenTraFi API",
 		version="0.1.0",
 		lifespan=lifespan,
+		# Render every JSON response through orjson's compiled encoder; the
+		# dashboard endpoint keeps its own pre-serialized fast path.
+		default_response_class=ORJSONResponse,
 	)
 	app.add_middleware(
 		TrustedHostMiddleware,
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import sys
 from decimal import Decimal
 from datetime import date, datetime, timezone
 from typing import Optional
 
 from sqlmodel import Field, SQLModel
-from sqlalchemy import Column, Numeric, UniqueConstraint
+from sqlalchemy import Column, Index, Numeric, String, TypeDecorator, UniqueConstraint
 
 CASH_ACCOUNT_TYPES = ("ALIPAY", "WECHAT", "BANK", "CASH", "OTHER")
 SUPPORTED_CURRENCIES = ("CNY", "USD", "HKD")
@@ -64,6 +65,30 @@ AGENT_TASK_STATUSES = ("PENDING", "RUNNING", "DONE", "FAILED")
 OUTBOX_JOB_TYPES = ("SNAPSHOT_REBUILD", "AGENT_TASK_EXECUTION")
 OUTBOX_JOB_STATUSES = ("PENDING", "RUNNING", "DONE", "FAILED")
 AGENT_REGISTRATION_STATUSES = ("ACTIVE", "INACTIVE")
+PORTFOLIO_ROLLUP_GRANULARITIES = ("day", "month")
+# Frozen companions for the choice tuples above: validators do O(1) membership
+# checks against these while the tuples keep the ordering used in error messages.
+CASH_ACCOUNT_TYPES_SET = frozenset(CASH_ACCOUNT_TYPES)
+SUPPORTED_CURRENCIES_SET = frozenset(SUPPORTED_CURRENCIES)
+SECURITY_MARKETS_SET = frozenset(SECURITY_MARKETS)
+HOLDING_TRANSACTION_SIDES_SET = frozenset(HOLDING_TRANSACTION_SIDES)
+SELL_PROCEEDS_HANDLINGS_SET = frozenset(SELL_PROCEEDS_HANDLINGS)
+BUY_FUNDING_HANDLINGS_SET = frozenset(BUY_FUNDING_HANDLINGS)
+CASH_LEDGER_ENTRY_TYPES_SET = frozenset(CASH_LEDGER_ENTRY_TYPES)
+FIXED_ASSET_CATEGORIES_SET = frozenset(FIXED_ASSET_CATEGORIES)
+LIABILITY_CATEGORIES_SET = frozenset(LIABILITY_CATEGORIES)
+LIABILITY_CURRENCIES_SET = SUPPORTED_CURRENCIES_SET
+OTHER_ASSET_CATEGORIES_SET = frozenset(OTHER_ASSET_CATEGORIES)
+DASHBOARD_SERIES_SCOPES_SET = frozenset(DASHBOARD_SERIES_SCOPES)
+DASHBOARD_CORRECTION_ACTIONS_SET = frozenset(DASHBOARD_CORRECTION_ACTIONS)
+DASHBOARD_CORRECTION_GRANULARITIES_SET = frozenset(DASHBOARD_CORRECTION_GRANULARITIES)
+FEEDBACK_CATEGORIES_SET = frozenset(FEEDBACK_CATEGORIES)
+FEEDBACK_PRIORITIES_SET = frozenset(FEEDBACK_PRIORITIES)
+FEEDBACK_SOURCES_SET = frozenset(FEEDBACK_SOURCES)
+FEEDBACK_STATUSES_SET = frozenset(FEEDBACK_STATUSES)
+INBOX_MESSAGE_KINDS_SET = frozenset(INBOX_MESSAGE_KINDS)
+AGENT_TASK_TYPES_SET = frozenset(AGENT_TASK_TYPES)
+AGENT_TASK_STATUSES_SET = frozenset(AGENT_TASK_STATUSES)
 FIXED_NUMERIC_PRECISION = 24
 FIXED_NUMERIC_SCALE = 8
 
@@ -82,9 +107,33 @@ def fixed_numeric_column(
 	)
 
 
+# Bound once at import: utc_now runs as a default_factory on every inserted
+# row, so skip the repeated datetime/timezone attribute lookups.
+_datetime_now = datetime.now
+_UTC = timezone.utc
+
+
 def utc_now() -> datetime:
 	"""Return the current UTC timestamp."""
-	return datetime.now(timezone.utc)
+	return _datetime_now(_UTC)
+
+
+class InternedString(TypeDecorator):
+	"""String column that interns values loaded from the database.
+
+	Currency, market, and category columns draw from small fixed
+	vocabularies, so interning on load collapses the per-row copies into one
+	shared object per value and lets downstream grouping and dict lookups
+	short-circuit on pointer equality.
+	"""
+
+	impl = String
+	cache_ok = True
+
+	def process_result_value(self, value: str | None, dialect: object) -> str | None:
+		if value is None:
+			return value
+		return sys.intern(value)
 
 
 class UserAccount(SQLModel, table=True):
@@ -93,7 +142,7 @@ class UserAccount(SQLModel, table=True):
 	password_digest: str = Field(max_length=512)
 	email_digest: str | None = Field(default=None, max_length=64, index=True)
 	created_at: datetime = Field(default_factory=utc_now, nullable=False)
-	updated_at: datetime = Field(default_factory=utc_now, nullable=False)
+	updated_at: datetime = Field(default_factory=utc_now, nullable=False, sa_column_kwargs={"onupdate": utc_now})
 
 
 class AgentAccessToken(SQLModel, table=True):
@@ -111,7 +160,7 @@ class AgentAccessToken(SQLModel, table=True):
 	token_digest: str = Field(index=True, max_length=64)
 	token_hint: str = Field(max_length=16)
 	created_at: datetime = Field(default_factory=utc_now, nullable=False, index=True)
-	updated_at: datetime = Field(default_factory=utc_now, nullable=False, index=True)
+	updated_at: datetime = Field(default_factory=utc_now, nullable=False, index=True, sa_column_kwargs={"onupdate": utc_now})
 	last_used_at: datetime | None = Field(default=None, index=True)
 	expires_at: datetime | None = Field(default=None, index=True)
 	revoked_at: datetime | None = Field(default=None, index=True)
@@ -133,7 +182,7 @@ class AgentRegistration(SQLModel, table=True):
 	request_count: int = Field(default=0, nullable=False)
 	latest_api_key_name: str | None = Field(default=None, max_length=80)
 	created_at: datetime = Field(default_factory=utc_now, nullable=False, index=True)
-	updated_at: datetime = Field(default_factory=utc_now, nullable=False, index=True)
+	updated_at: datetime = Field(default_factory=utc_now, nullable=False, index=True, sa_column_kwargs={"onupdate": utc_now})
 	last_seen_at: datetime | None = Field(default=None, index=True)
 
 
@@ -141,7 +190,7 @@ class UserFeedback(SQLModel, table=True):
 	id: Optional[int] = Field(default=None, primary_key=True)
 	user_id: str = Field(index=True, max_length=32)
 	message: str = Field(max_length=1000)
-	category: str = Field(default="USER_REQUEST", index=True, max_length=32)
+	category: str = Field(default="USER_REQUEST", index=True, max_length=32, sa_type=InternedString(length=32))
 	priority: str = Field(default="MEDIUM", index=True, max_length=16)
 	source: str = Field(default="USER", index=True, max_length=32)
 	status: str = Field(default="OPEN", index=True, max_length=16)
@@ -217,29 +266,33 @@ class CashAccount(SQLModel, table=True):
 	user_id: str = Field(index=True, max_length=32)
 	name: str
 	platform: str
-	currency: str = Field(default="CNY", max_length=8)
+	currency: str = Field(default="CNY", max_length=8, sa_type=InternedString(length=8))
 	balance: Decimal = Field(default=Decimal("0"), sa_column=fixed_numeric_column())
-	account_type: str = Field(default="OTHER", max_length=20)
+	account_type: str = Field(default="OTHER", max_length=20, sa_type=InternedString(length=20))
 	started_on: Optional[date] = Field(default=None)
 	note: Optional[str] = Field(default=None, max_length=500)
 	created_at: datetime = Field(default_factory=utc_now, nullable=False)
-	updated_at: datetime = Field(default_factory=utc_now, nullable=False)
+	updated_at: datetime = Field(default_factory=utc_now, nullable=False, sa_column_kwargs={"onupdate": utc_now})
 
 
 class SecurityHolding(SQLModel, table=True):
+	__table_args__ = (
+		Index("ix_securityholding_user_symbol", "user_id", "symbol"),
+	)
+
 	id: Optional[int] = Field(default=None, primary_key=True)
-	user_id: str = Field(index=True, max_length=32)
-	symbol: str = Field(index=True)
+	user_id: str = Field(max_length=32)
+	symbol: str
 	name: str
 	quantity: Decimal = Field(default=Decimal("0"), sa_column=fixed_numeric_column())
-	fallback_currency: str = Field(default="CNY", max_length=8)
+	fallback_currency: str = Field(default="CNY", max_length=8, sa_type=InternedString(length=8))
 	cost_basis_price: Decimal | None = Field(default=None, sa_column=fixed_numeric_column(nullable=True))
-	market: str = Field(default="OTHER", max_length=16)
+	market: str = Field(default="OTHER", max_length=16, sa_type=InternedString(length=16))
 	broker: Optional[str] = Field(default=None, max_length=120)
 	started_on: Optional[date] = Field(default=None)
 	note: Optional[str] = Field(default=None, max_length=500)
 	created_at: datetime = Field(default_factory=utc_now, nullable=False)
-	updated_at: datetime = Field(default_factory=utc_now, nullable=False)
+	updated_at: datetime = Field(default_factory=utc_now, nullable=False, sa_column_kwargs={"onupdate": utc_now})
 
 
 class SecurityHoldingTransaction(SQLModel, table=True):
@@ -250,13 +303,13 @@ class SecurityHoldingTransaction(SQLModel, table=True):
 	side: str = Field(default="BUY", index=True, max_length=12)
 	quantity: Decimal = Field(gt=0, sa_column=fixed_numeric_column())
 	price: Decimal | None = Field(default=None, sa_column=fixed_numeric_column(nullable=True))
-	fallback_currency: str = Field(default="CNY", max_length=8)
-	market: str = Field(default="OTHER", max_length=16)
+	fallback_currency: str = Field(default="CNY", max_length=8, sa_type=InternedString(length=8))
+	market: str = Field(default="OTHER", max_length=16, sa_type=InternedString(length=16))
 	broker: Optional[str] = Field(default=None, max_length=120)
 	traded_on: date = Field(index=True)
 	note: Optional[str] = Field(default=None, max_length=500)
 	created_at: datetime = Field(default_factory=utc_now, nullable=False, index=True)
-	updated_at: datetime = Field(default_factory=utc_now, nullable=False)
+	updated_at: datetime = Field(default_factory=utc_now, nullable=False, sa_column_kwargs={"onupdate": utc_now})
 
 
 class HoldingTransactionCashSettlement(SQLModel, table=True):
@@ -273,13 +326,13 @@ class HoldingTransactionCashSettlement(SQLModel, table=True):
 	cash_account_id: int = Field(index=True)
 	handling: str = Field(max_length=32)
 	settled_amount: Decimal = Field(default=Decimal("0"), sa_column=fixed_numeric_column())
-	settled_currency: str = Field(default="CNY", max_length=8)
+	settled_currency: str = Field(default="CNY", max_length=8, sa_type=InternedString(length=8))
 	source_amount: Decimal = Field(default=Decimal("0"), sa_column=fixed_numeric_column())
-	source_currency: str = Field(default="CNY", max_length=8)
+	source_currency: str = Field(default="CNY", max_length=8, sa_type=InternedString(length=8))
 	flow_direction: str = Field(default="INFLOW", max_length=8)
 	auto_created_cash_account: bool = Field(default=False)
 	created_at: datetime = Field(default_factory=utc_now, nullable=False, index=True)
-	updated_at: datetime = Field(default_factory=utc_now, nullable=False)
+	updated_at: datetime = Field(default_factory=utc_now, nullable=False, sa_column_kwargs={"onupdate": utc_now})
 
 
 class CashLedgerEntry(SQLModel, table=True):
@@ -288,13 +341,13 @@ class CashLedgerEntry(SQLModel, table=True):
 	cash_account_id: int = Field(index=True)
 	entry_type: str = Field(default="INITIAL_BALANCE", index=True, max_length=32)
 	amount: Decimal = Field(default=Decimal("0"), sa_column=fixed_numeric_column())
-	currency: str = Field(default="CNY", max_length=8)
+	currency: str = Field(default="CNY", max_length=8, sa_type=InternedString(length=8))
 	happened_on: date = Field(index=True)
 	note: Optional[str] = Field(default=None, max_length=500)
 	holding_transaction_id: int | None = Field(default=None, index=True)
 	cash_transfer_id: int | None = Field(default=None, index=True)
 	created_at: datetime = Field(default_factory=utc_now, nullable=False, index=True)
-	updated_at: datetime = Field(default_factory=utc_now, nullable=False)
+	updated_at: datetime = Field(default_factory=utc_now, nullable=False, sa_column_kwargs={"onupdate": utc_now})
 
 
 class CashTransfer(SQLModel, table=True):
@@ -304,12 +357,12 @@ class CashTransfer(SQLModel, table=True):
 	to_account_id: int = Field(index=True)
 	source_amount: Decimal = Field(gt=0, sa_column=fixed_numeric_column())
 	target_amount: Decimal = Field(gt=0, sa_column=fixed_numeric_column())
-	source_currency: str = Field(default="CNY", max_length=8)
-	target_currency: str = Field(default="CNY", max_length=8)
+	source_currency: str = Field(default="CNY", max_length=8, sa_type=InternedString(length=8))
+	target_currency: str = Field(default="CNY", max_length=8, sa_type=InternedString(length=8))
 	transferred_on: date = Field(index=True)
 	note: Optional[str] = Field(default=None, max_length=500)
 	created_at: datetime = Field(default_factory=utc_now, nullable=False, index=True)
-	updated_at: datetime = Field(default_factory=utc_now, nullable=False)
+	updated_at: datetime = Field(default_factory=utc_now, nullable=False, sa_column_kwargs={"onupdate": utc_now})
 
 
 class AgentIdempotencyKey(SQLModel, table=True):
@@ -329,7 +382,7 @@ class AgentIdempotencyKey(SQLModel, table=True):
 	request_hash: str = Field(max_length=64)
 	response_json: str = Field(max_length=16000)
 	created_at: datetime = Field(default_factory=utc_now, nullable=False, index=True)
-	updated_at: datetime = Field(default_factory=utc_now, nullable=False, index=True)
+	updated_at: datetime = Field(default_factory=utc_now, nullable=False, index=True, sa_column_kwargs={"onupdate": utc_now})
 
 
 class AgentTask(SQLModel, table=True):
@@ -344,7 +397,7 @@ class AgentTask(SQLModel, table=True):
 	result_json: str | None = Field(default=None, max_length=16000)
 	error_message: str | None = Field(default=None, max_length=1000)
 	created_at: datetime = Field(default_factory=utc_now, nullable=False, index=True)
-	updated_at: datetime = Field(default_factory=utc_now, nullable=False, index=True)
+	updated_at: datetime = Field(default_factory=utc_now, nullable=False, index=True, sa_column_kwargs={"onupdate": utc_now})
 	completed_at: datetime | None = Field(default=None, index=True)
 
 
@@ -361,80 +414,127 @@ class OutboxJob(SQLModel, table=True):
 	started_at: datetime | None = Field(default=None, index=True)
 	completed_at: datetime | None = Field(default=None, index=True)
 	created_at: datetime = Field(default_factory=utc_now, nullable=False, index=True)
-	updated_at: datetime = Field(default_factory=utc_now, nullable=False, index=True)
+	updated_at: datetime = Field(default_factory=utc_now, nullable=False, index=True, sa_column_kwargs={"onupdate": utc_now})
 
 
 class FixedAsset(SQLModel, table=True):
 	id: Optional[int] = Field(default=None, primary_key=True)
 	user_id: str = Field(index=True, max_length=32)
 	name: str
-	category: str = Field(default="OTHER", max_length=24)
+	category: str = Field(default="OTHER", max_length=24, sa_type=InternedString(length=24))
 	current_value_cny: Decimal = Field(default=Decimal("0"), sa_column=fixed_numeric_column())
 	purchase_value_cny: Decimal | None = Field(default=None, sa_column=fixed_numeric_column(nullable=True))
 	started_on: Optional[date] = Field(default=None)
 	note: Optional[str] = Field(default=None, max_length=500)
 	created_at: datetime = Field(default_factory=utc_now, nullable=False)
-	updated_at: datetime = Field(default_factory=utc_now, nullable=False)
+	updated_at: datetime = Field(default_factory=utc_now, nullable=False, sa_column_kwargs={"onupdate": utc_now})
 
 
 class LiabilityEntry(SQLModel, table=True):
 	id: Optional[int] = Field(default=None, primary_key=True)
 	user_id: str = Field(index=True, max_length=32)
 	name: str
-	category: str = Field(default="OTHER", max_length=24)
-	currency: str = Field(default="CNY", max_length=8)
+	category: str = Field(default="OTHER", max_length=24, sa_type=InternedString(length=24))
+	currency: str = Field(default="CNY", max_length=8, sa_type=InternedString(length=8))
 	balance: Decimal = Field(default=Decimal("0"), sa_column=fixed_numeric_column())
 	started_on: Optional[date] = Field(default=None)
 	note: Optional[str] = Field(default=None, max_length=500)
 	created_at: datetime = Field(default_factory=utc_now, nullable=False)
-	updated_at: datetime = Field(default_factory=utc_now, nullable=False)
+	updated_at: datetime = Field(default_factory=utc_now, nullable=False, sa_column_kwargs={"onupdate": utc_now})
 
 
 class OtherAsset(SQLModel, table=True):
 	id: Optional[int] = Field(default=None, primary_key=True)
 	user_id: str = Field(index=True, max_length=32)
 	name: str
-	category: str = Field(default="OTHER", max_length=24)
+	category: str = Field(default="OTHER", max_length=24, sa_type=InternedString(length=24))
 	current_value_cny: Decimal = Field(default=Decimal("0"), sa_column=fixed_numeric_column())
 	original_value_cny: Decimal | None = Field(default=None, sa_column=fixed_numeric_column(nullable=True))
 	started_on: Optional[date] = Field(default=None)
 	note: Optional[str] = Field(default=None, max_length=500)
 	created_at: datetime = Field(default_factory=utc_now, nullable=False)
-	updated_at: datetime = Field(default_factory=utc_now, nullable=False)
+	updated_at: datetime = Field(default_factory=utc_now, nullable=False, sa_column_kwargs={"onupdate": utc_now})
 
 
 class PortfolioSnapshot(SQLModel, table=True):
+	__table_args__ = (
+		Index("ix_portfoliosnapshot_user_created", "user_id", "created_at"),
+	)
+
 	id: Optional[int] = Field(default=None, primary_key=True)
 	user_id: str = Field(index=True, max_length=32)
 	total_value_cny: Decimal = Field(default=Decimal("0"), sa_column=fixed_numeric_column())
-	created_at: datetime = Field(default_factory=utc_now, nullable=False, index=True)
+	created_at: datetime = Field(default_factory=utc_now, nullable=False)
+
+
+class PortfolioSnapshotRollup(SQLModel, table=True):
+	__table_args__ = (
+		Index(
+			"ix_portfoliosnapshotrollup_user_granularity_bucket",
+			"user_id",
+			"granularity",
+			"bucket_start_utc",
+			unique=True,
+		),
+	)
+
+	id: Optional[int] = Field(default=None, primary_key=True)
+	user_id: str = Field(max_length=32)
+	granularity: str = Field(max_length=8)
+	bucket_start_utc: datetime = Field(nullable=False)
+	total_value_cny: Decimal = Field(default=Decimal("0"), sa_column=fixed_numeric_column())
+	updated_at: datetime = Field(default_factory=utc_now, nullable=False, sa_column_kwargs={"onupdate": utc_now})
 
 
 class HoldingPerformanceSnapshot(SQLModel, table=True):
+	__table_args__ = (
+		Index(
+			"ix_holdingperformancesnapshot_user_scope_symbol_created",
+			"user_id",
+			"scope",
+			"symbol",
+			"created_at",
+		),
+	)
+
 	id: Optional[int] = Field(default=None, primary_key=True)
 	user_id: str = Field(index=True, max_length=32)
 	scope: str = Field(default="TOTAL", max_length=16, index=True)
 	symbol: Optional[str] = Field(default=None, index=True)
 	name: Optional[str] = Field(default=None, max_length=120)
 	return_pct: Decimal = Field(default=Decimal("0"), sa_column=fixed_numeric_column())
-	created_at: datetime = Field(default_factory=utc_now, nullable=False, index=True)
+	created_at: datetime = Field(default_factory=utc_now, nullable=False)
 
 
 class RealtimePortfolioSnapshot(SQLModel, table=True):
+	__table_args__ = (
+		Index("ix_realtimeportfoliosnapshot_user_created", "user_id", "created_at"),
+	)
+
 	id: Optional[int] = Field(default=None, primary_key=True)
 	user_id: str = Field(index=True, max_length=32)
 	total_value_cny: Decimal = Field(default=Decimal("0"), sa_column=fixed_numeric_column())
-	created_at: datetime = Field(default_factory=utc_now, nullable=False, index=True)
+	created_at: datetime = Field(default_factory=utc_now, nullable=False)
 
 
 class RealtimeHoldingPerformanceSnapshot(SQLModel, table=True):
+	__table_args__ = (
+		Index(
+			"ix_realtimeholdingperformancesnapshot_user_scope_symbol_created",
+			"user_id",
+			"scope",
+			"symbol",
+			"created_at",
+		),
+	)
+
 	id: Optional[int] = Field(default=None, primary_key=True)
 	user_id: str = Field(index=True, max_length=32)
 	scope: str = Field(default="TOTAL", max_length=16, index=True)
 	symbol: Optional[str] = Field(default=None, index=True)
 	name: Optional[str] = Field(default=None, max_length=120)
 	return_pct: Decimal = Field(default=Decimal("0"), sa_column=fixed_numeric_column())
-	created_at: datetime = Field(default_factory=utc_now, nullable=False, index=True)
+	created_at: datetime = Field(default_factory=utc_now, nullable=False)
 
 
 class DashboardCorrection(SQLModel, table=True):
@@ -448,7 +548,7 @@ class DashboardCorrection(SQLModel, table=True):
 	corrected_value: Decimal | None = Field(default=None, sa_column=fixed_numeric_column(nullable=True))
 	reason: str = Field(max_length=500)
 	created_at: datetime = Field(default_factory=utc_now, nullable=False, index=True)
-	updated_at: datetime = Field(default_factory=utc_now, nullable=False)
+	updated_at: datetime = Field(default_factory=utc_now, nullable=False, sa_column_kwargs={"onupdate": utc_now})
 
 
 class AssetMutationAudit(SQLModel, table=True):
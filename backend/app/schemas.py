@@ -3,10 +3,22 @@ from __future__ import annotations
 from datetime import date, datetime, timezone
 from decimal import Decimal
 import re
-from typing import Any, Optional
+import sys
+from typing import Annotated, Any, Optional
 from urllib.parse import urlparse
 
-from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator, model_validator
+from pydantic import (
+	BaseModel,
+	BeforeValidator,
+	ConfigDict,
+	Field,
+	StringConstraints,
+	TypeAdapter,
+	ValidationInfo,
+	field_serializer,
+	field_validator,
+	model_validator,
+)
 
 from app.fixed_precision import (
 	FIXED_EPSILON,
@@ -16,32 +28,56 @@ from app.fixed_precision import (
 )
 from app.models import (
 	AGENT_TASK_STATUSES,
+	AGENT_TASK_STATUSES_SET,
 	AGENT_TASK_TYPES,
+	AGENT_TASK_TYPES_SET,
 	BUY_FUNDING_HANDLINGS,
+	BUY_FUNDING_HANDLINGS_SET,
 	CASH_ACCOUNT_TYPES,
+	CASH_ACCOUNT_TYPES_SET,
 	CASH_LEDGER_ENTRY_TYPES,
+	CASH_LEDGER_ENTRY_TYPES_SET,
 	CASH_SETTLEMENT_DIRECTIONS,
 	DASHBOARD_CORRECTION_ACTIONS,
+	DASHBOARD_CORRECTION_ACTIONS_SET,
 	DASHBOARD_CORRECTION_GRANULARITIES,
+	DASHBOARD_CORRECTION_GRANULARITIES_SET,
 	DASHBOARD_SERIES_SCOPES,
+	DASHBOARD_SERIES_SCOPES_SET,
 	FEEDBACK_CATEGORIES,
+	FEEDBACK_CATEGORIES_SET,
 	INBOX_MESSAGE_KINDS,
+	INBOX_MESSAGE_KINDS_SET,
 	FEEDBACK_PRIORITIES,
+	FEEDBACK_PRIORITIES_SET,
 	FEEDBACK_SOURCES,
+	FEEDBACK_SOURCES_SET,
 	FEEDBACK_STATUSES,
+	FEEDBACK_STATUSES_SET,
 	FIXED_ASSET_CATEGORIES,
+	FIXED_ASSET_CATEGORIES_SET,
 	HOLDING_TRANSACTION_SIDES,
+	HOLDING_TRANSACTION_SIDES_SET,
 	LIABILITY_CATEGORIES,
+	LIABILITY_CATEGORIES_SET,
 	LIABILITY_CURRENCIES,
+	LIABILITY_CURRENCIES_SET,
 	OTHER_ASSET_CATEGORIES,
+	OTHER_ASSET_CATEGORIES_SET,
 	SELL_PROCEEDS_HANDLINGS,
+	SELL_PROCEEDS_HANDLINGS_SET,
 	SECURITY_MARKETS,
+	SECURITY_MARKETS_SET,
 	SUPPORTED_CURRENCIES,
+	SUPPORTED_CURRENCIES_SET,
 )
 from app.security import normalize_email, normalize_user_id, validate_password_strength
 
 AGENT_TOKEN_NAME_PATTERN = re.compile(r"^[a-z]+(?:-[a-z]+)*$")
 
+# Markets whose holdings may carry fractional quantities (fund shares, crypto).
+_FRACTIONAL_MARKETS: frozenset[str] = frozenset({"FUND", "CRYPTO"})
+
 
 def _normalize_optional_text(value: str | None) -> str | None:
 	if value is None:
@@ -59,19 +95,51 @@ def _normalize_required_text(value: str, field_name: str) -> str:
 	return stripped
 
 
-def _normalize_choice(
-	value: str | None,
+def _normalize_required_field(value: str, info: ValidationInfo) -> str:
+	return _normalize_required_text(value, info.field_name)
+
+
+# Annotated aliases bind the trim helpers once per field instead of going
+# through a per-class classmethod wrapper on every request.
+TrimmedOptionalText = Annotated[Optional[str], BeforeValidator(_normalize_optional_text)]
+TrimmedRequiredText = Annotated[str, BeforeValidator(_normalize_required_field)]
+
+# Shared StringConstraints aliases: identical Annotated types let Pydantic reuse
+# one compiled core schema across the models below instead of rebuilding the
+# same length constraints per class.
+Name80 = Annotated[str, StringConstraints(min_length=1, max_length=80, strip_whitespace=True)]
+Name120 = Annotated[str, StringConstraints(min_length=1, max_length=120, strip_whitespace=True)]
+Symbol32 = Annotated[str, StringConstraints(min_length=1, max_length=32, strip_whitespace=True)]
+Currency8 = Annotated[str, StringConstraints(min_length=3, max_length=8)]
+UserId32 = Annotated[str, StringConstraints(min_length=3, max_length=32)]
+Email320 = Annotated[str, StringConstraints(min_length=3, max_length=320)]
+
+
+def _make_choice_validator(
+	allowed_set: frozenset[str],
 	allowed_values: tuple[str, ...],
 	field_name: str,
-) -> str | None:
-	if value is None:
-		return None
+):
+	# Already-canonical inputs (the common case for frontend payloads) skip the
+	# strip()/upper() allocations and come back as the interned constant.
+	canonical = {value: sys.intern(value) for value in allowed_values}
+	message = f"{field_name} must be one of: {', '.join(allowed_values)}."
+
+	def _validate(cls, value: str | None) -> str | None:
+		if value is None:
+			return None
 
-	normalized = value.strip().upper()
-	if normalized not in allowed_values:
-		raise ValueError(f"{field_name} must be one of: {', '.join(allowed_values)}.")
+		interned = canonical.get(value)
+		if interned is not None:
+			return interned
 
-	return normalized
+		normalized = value.strip().upper()
+		if normalized not in allowed_set:
+			raise ValueError(message)
+
+		return normalized
+
+	return _validate
 
 
 def _coerce_utc_datetime(value: datetime) -> datetime:
@@ -130,64 +198,38 @@ class UtcTimestampResponseModel(BaseModel):
 		return value
 
 
-class CashAccountCreate(BaseModel):
-	name: str = Field(min_length=1, max_length=80)
-	platform: str = Field(min_length=1, max_length=80)
-	currency: str = Field(default="CNY", min_length=3, max_length=8)
+class CashAccountBase(BaseModel):
+	name: Name80
+	platform: Name80
+	currency: Currency8 = "CNY"
 	balance: Decimal
-	account_type: str = Field(default="OTHER", min_length=4, max_length=20)
 	started_on: Optional[date] = None
-	note: Optional[str] = Field(default=None, max_length=500)
+	note: TrimmedOptionalText = Field(default=None, max_length=500)
 
-	@field_validator("account_type", mode="before")
-	@classmethod
-	def validate_account_type(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, CASH_ACCOUNT_TYPES, "account_type")
-
-	@field_validator("currency", mode="before")
-	@classmethod
-	def validate_currency(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, SUPPORTED_CURRENCIES, "currency")
+	validate_currency = field_validator("currency", mode="before")(
+		classmethod(_make_choice_validator(SUPPORTED_CURRENCIES_SET, SUPPORTED_CURRENCIES, "currency")),
+	)
 
 	@field_validator("balance", mode="before")
 	@classmethod
 	def normalize_balance(cls, value: Any) -> Decimal:
 		return _normalize_non_negative_decimal(value, "余额")
 
-	@field_validator("note", mode="before")
-	@classmethod
-	def normalize_note(cls, value: str | None) -> str | None:
-		return _normalize_optional_text(value)
 
+class CashAccountCreate(CashAccountBase):
+	account_type: str = Field(default="OTHER", min_length=4, max_length=20)
 
-class CashAccountUpdate(BaseModel):
-	name: str = Field(min_length=1, max_length=80)
-	platform: str = Field(min_length=1, max_length=80)
-	currency: str = Field(default="CNY", min_length=3, max_length=8)
-	balance: Decimal
-	account_type: Optional[str] = Field(default=None, min_length=4, max_length=20)
-	started_on: Optional[date] = None
-	note: Optional[str] = Field(default=None, max_length=500)
+	validate_account_type = field_validator("account_type", mode="before")(
+		classmethod(_make_choice_validator(CASH_ACCOUNT_TYPES_SET, CASH_ACCOUNT_TYPES, "account_type")),
+	)
 
-	@field_validator("account_type", mode="before")
-	@classmethod
-	def validate_account_type(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, CASH_ACCOUNT_TYPES, "account_type")
 
-	@field_validator("currency", mode="before")
-	@classmethod
-	def validate_currency(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, SUPPORTED_CURRENCIES, "currency")
+class CashAccountUpdate(CashAccountBase):
+	account_type: Optional[str] = Field(default=None, min_length=4, max_length=20)
 
-	@field_validator("balance", mode="before")
-	@classmethod
-	def normalize_balance(cls, value: Any) -> Decimal:
-		return _normalize_non_negative_decimal(value, "余额")
-
-	@field_validator("note", mode="before")
-	@classmethod
-	def normalize_note(cls, value: str | None) -> str | None:
-		return _normalize_optional_text(value)
+	validate_account_type = field_validator("account_type", mode="before")(
+		classmethod(_make_choice_validator(CASH_ACCOUNT_TYPES_SET, CASH_ACCOUNT_TYPES, "account_type")),
+	)
 
 
 class CashAccountRead(BaseModel):
@@ -204,27 +246,21 @@ class CashAccountRead(BaseModel):
 
 
 class FixedAssetBase(BaseModel):
-	name: str = Field(min_length=1, max_length=120)
+	name: Name120
 	category: str = Field(default="OTHER", min_length=4, max_length=24)
 	current_value_cny: Decimal
 	started_on: Optional[date] = None
-	note: Optional[str] = Field(default=None, max_length=500)
+	note: TrimmedOptionalText = Field(default=None, max_length=500)
 
-	@field_validator("category", mode="before")
-	@classmethod
-	def validate_category(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, FIXED_ASSET_CATEGORIES, "category")
+	validate_category = field_validator("category", mode="before")(
+		classmethod(_make_choice_validator(FIXED_ASSET_CATEGORIES_SET, FIXED_ASSET_CATEGORIES, "category")),
+	)
 
 	@field_validator("current_value_cny", mode="before")
 	@classmethod
 	def normalize_current_value_cny(cls, value: Any) -> Decimal:
 		return _normalize_positive_decimal(value, "当前价值")
 
-	@field_validator("note", mode="before")
-	@classmethod
-	def normalize_note(cls, value: str | None) -> str | None:
-		return _normalize_optional_text(value)
-
 
 class FixedAssetCreate(FixedAssetBase):
 	purchase_value_cny: Decimal | None = None
@@ -256,62 +292,37 @@ class FixedAssetRead(BaseModel):
 	return_pct: Optional[float] = None
 
 
-class LiabilityEntryCreate(BaseModel):
-	name: str = Field(min_length=1, max_length=120)
-	category: str = Field(default="OTHER", min_length=4, max_length=24)
-	currency: str = Field(default="CNY", min_length=3, max_length=8)
+class LiabilityEntryBase(BaseModel):
+	name: Name120
+	currency: Currency8 = "CNY"
 	balance: Decimal
 	started_on: Optional[date] = None
-	note: Optional[str] = Field(default=None, max_length=500)
-
-	@field_validator("category", mode="before")
-	@classmethod
-	def validate_category(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, LIABILITY_CATEGORIES, "category")
+	note: TrimmedOptionalText = Field(default=None, max_length=500)
 
-	@field_validator("currency", mode="before")
-	@classmethod
-	def validate_currency(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, LIABILITY_CURRENCIES, "currency")
+	validate_currency = field_validator("currency", mode="before")(
+		classmethod(_make_choice_validator(LIABILITY_CURRENCIES_SET, LIABILITY_CURRENCIES, "currency")),
+	)
 
 	@field_validator("balance", mode="before")
 	@classmethod
 	def normalize_balance(cls, value: Any) -> Decimal:
 		return _normalize_non_negative_decimal(value, "负债余额")
 
-	@field_validator("note", mode="before")
-	@classmethod
-	def normalize_note(cls, value: str | None) -> str | None:
-		return _normalize_optional_text(value)
-
 
-class LiabilityEntryUpdate(BaseModel):
-	name: str = Field(min_length=1, max_length=120)
-	category: Optional[str] = Field(default=None, min_length=4, max_length=24)
-	currency: str = Field(default="CNY", min_length=3, max_length=8)
-	balance: Decimal
-	started_on: Optional[date] = None
-	note: Optional[str] = Field(default=None, max_length=500)
+class LiabilityEntryCreate(LiabilityEntryBase):
+	category: str = Field(default="OTHER", min_length=4, max_length=24)
 
-	@field_validator("category", mode="before")
-	@classmethod
-	def validate_category(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, LIABILITY_CATEGORIES, "category")
+	validate_category = field_validator("category", mode="before")(
+		classmethod(_make_choice_validator(LIABILITY_CATEGORIES_SET, LIABILITY_CATEGORIES, "category")),
+	)
 
-	@field_validator("currency", mode="before")
-	@classmethod
-	def validate_currency(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, LIABILITY_CURRENCIES, "currency")
 
-	@field_validator("balance", mode="before")
-	@classmethod
-	def normalize_balance(cls, value: Any) -> Decimal:
-		return _normalize_non_negative_decimal(value, "负债余额")
+class LiabilityEntryUpdate(LiabilityEntryBase):
+	category: Optional[str] = Field(default=None, min_length=4, max_length=24)
 
-	@field_validator("note", mode="before")
-	@classmethod
-	def normalize_note(cls, value: str | None) -> str | None:
-		return _normalize_optional_text(value)
+	validate_category = field_validator("category", mode="before")(
+		classmethod(_make_choice_validator(LIABILITY_CATEGORIES_SET, LIABILITY_CATEGORIES, "category")),
+	)
 
 
 class LiabilityEntryRead(BaseModel):
@@ -327,27 +338,21 @@ class LiabilityEntryRead(BaseModel):
 
 
 class OtherAssetBase(BaseModel):
-	name: str = Field(min_length=1, max_length=120)
+	name: Name120
 	category: str = Field(default="OTHER", min_length=4, max_length=24)
 	current_value_cny: Decimal
 	started_on: Optional[date] = None
-	note: Optional[str] = Field(default=None, max_length=500)
+	note: TrimmedOptionalText = Field(default=None, max_length=500)
 
-	@field_validator("category", mode="before")
-	@classmethod
-	def validate_category(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, OTHER_ASSET_CATEGORIES, "category")
+	validate_category = field_validator("category", mode="before")(
+		classmethod(_make_choice_validator(OTHER_ASSET_CATEGORIES_SET, OTHER_ASSET_CATEGORIES, "category")),
+	)
 
 	@field_validator("current_value_cny", mode="before")
 	@classmethod
 	def normalize_current_value_cny(cls, value: Any) -> Decimal:
 		return _normalize_positive_decimal(value, "当前价值")
 
-	@field_validator("note", mode="before")
-	@classmethod
-	def normalize_note(cls, value: str | None) -> str | None:
-		return _normalize_optional_text(value)
-
 
 class OtherAssetCreate(OtherAssetBase):
 	original_value_cny: Decimal | None = None
@@ -380,8 +385,8 @@ class OtherAssetRead(BaseModel):
 
 
 class AuthRegisterCredentials(BaseModel):
-	user_id: str = Field(min_length=3, max_length=32)
-	email: str = Field(min_length=3, max_length=320)
+	user_id: UserId32
+	email: Email320
 	password: str = Field(min_length=8, max_length=128)
 
 	@field_validator("user_id", mode="before")
@@ -401,7 +406,7 @@ class AuthRegisterCredentials(BaseModel):
 
 
 class AuthLoginCredentials(BaseModel):
-	user_id: str = Field(min_length=3, max_length=32)
+	user_id: UserId32
 	password: str = Field(min_length=1, max_length=128)
 
 	@field_validator("user_id", mode="before")
@@ -433,7 +438,7 @@ class AgentTokenCreate(BaseModel):
 
 
 class AgentTokenIssueCreate(AgentTokenCreate):
-	user_id: str = Field(min_length=3, max_length=32)
+	user_id: UserId32
 	password: str = Field(min_length=1, max_length=128)
 
 	@field_validator("user_id", mode="before")
@@ -458,8 +463,8 @@ class AgentTokenIssueRead(AgentTokenRead):
 
 
 class PasswordResetRequest(BaseModel):
-	user_id: str = Field(min_length=3, max_length=32)
-	email: str = Field(min_length=3, max_length=320)
+	user_id: UserId32
+	email: Email320
 	new_password: str = Field(min_length=8, max_length=128)
 
 	@field_validator("user_id", mode="before")
@@ -483,7 +488,7 @@ class ActionMessageRead(BaseModel):
 
 
 class UserEmailUpdate(BaseModel):
-	email: str = Field(min_length=3, max_length=320)
+	email: Email320
 
 	@field_validator("email", mode="before")
 	@classmethod
@@ -492,37 +497,24 @@ class UserEmailUpdate(BaseModel):
 
 
 class UserFeedbackCreate(BaseModel):
-	message: str = Field(min_length=5, max_length=1000)
+	message: TrimmedRequiredText = Field(min_length=5, max_length=1000)
 	category: str | None = Field(default=None, max_length=32)
 	priority: str | None = Field(default=None, max_length=16)
 	source: str | None = Field(default=None, max_length=32)
-	fingerprint: str | None = Field(default=None, max_length=96)
+	fingerprint: TrimmedOptionalText = Field(default=None, max_length=96)
 	dedupe_window_minutes: int | None = Field(default=None, ge=1, le=10_080)
 
-	@field_validator("message", mode="before")
-	@classmethod
-	def normalize_message(cls, value: str) -> str:
-		return _normalize_required_text(value, "message")
+	normalize_category = field_validator("category", mode="before")(
+		classmethod(_make_choice_validator(FEEDBACK_CATEGORIES_SET, FEEDBACK_CATEGORIES, "category")),
+	)
 
-	@field_validator("category", mode="before")
-	@classmethod
-	def normalize_category(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, FEEDBACK_CATEGORIES, "category")
+	normalize_priority = field_validator("priority", mode="before")(
+		classmethod(_make_choice_validator(FEEDBACK_PRIORITIES_SET, FEEDBACK_PRIORITIES, "priority")),
+	)
 
-	@field_validator("priority", mode="before")
-	@classmethod
-	def normalize_priority(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, FEEDBACK_PRIORITIES, "priority")
-
-	@field_validator("source", mode="before")
-	@classmethod
-	def normalize_source(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, FEEDBACK_SOURCES, "source")
-
-	@field_validator("fingerprint", mode="before")
-	@classmethod
-	def normalize_fingerprint(cls, value: str | None) -> str | None:
-		return _normalize_optional_text(value)
+	normalize_source = field_validator("source", mode="before")(
+		classmethod(_make_choice_validator(FEEDBACK_SOURCES_SET, FEEDBACK_SOURCES, "source")),
+	)
 
 
 class UserFeedbackRead(UtcTimestampResponseModel):
@@ -571,14 +563,9 @@ class FeedbackSummaryRead(BaseModel):
 
 
 class AdminFeedbackReplyUpdate(BaseModel):
-	reply_message: str = Field(min_length=1, max_length=2000)
+	reply_message: TrimmedRequiredText = Field(min_length=1, max_length=2000)
 	close: bool = False
 
-	@field_validator("reply_message", mode="before")
-	@classmethod
-	def normalize_reply_message(cls, value: str) -> str:
-		return _normalize_required_text(value, "reply_message")
-
 
 class AdminFeedbackClassifyUpdate(BaseModel):
 	category: str | None = Field(default=None, max_length=32)
@@ -587,27 +574,23 @@ class AdminFeedbackClassifyUpdate(BaseModel):
 	status: str | None = Field(default=None, max_length=16)
 	assignee: str | None = Field(default=None, max_length=32)
 	ack_deadline: datetime | None = Field(default=None)
-	internal_note: str | None = Field(default=None, max_length=3000)
+	internal_note: TrimmedOptionalText = Field(default=None, max_length=3000)
 
-	@field_validator("category", mode="before")
-	@classmethod
-	def normalize_category(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, FEEDBACK_CATEGORIES, "category")
+	normalize_category = field_validator("category", mode="before")(
+		classmethod(_make_choice_validator(FEEDBACK_CATEGORIES_SET, FEEDBACK_CATEGORIES, "category")),
+	)
 
-	@field_validator("priority", mode="before")
-	@classmethod
-	def normalize_priority(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, FEEDBACK_PRIORITIES, "priority")
+	normalize_priority = field_validator("priority", mode="before")(
+		classmethod(_make_choice_validator(FEEDBACK_PRIORITIES_SET, FEEDBACK_PRIORITIES, "priority")),
+	)
 
-	@field_validator("source", mode="before")
-	@classmethod
-	def normalize_source(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, FEEDBACK_SOURCES, "source")
+	normalize_source = field_validator("source", mode="before")(
+		classmethod(_make_choice_validator(FEEDBACK_SOURCES_SET, FEEDBACK_SOURCES, "source")),
+	)
 
-	@field_validator("status", mode="before")
-	@classmethod
-	def normalize_status(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, FEEDBACK_STATUSES, "status")
+	normalize_status = field_validator("status", mode="before")(
+		classmethod(_make_choice_validator(FEEDBACK_STATUSES_SET, FEEDBACK_STATUSES, "status")),
+	)
 
 	@field_validator("assignee", mode="before")
 	@classmethod
@@ -616,16 +599,11 @@ class AdminFeedbackClassifyUpdate(BaseModel):
 			return None
 		return normalize_user_id(value)
 
-	@field_validator("internal_note", mode="before")
-	@classmethod
-	def normalize_internal_note(cls, value: str | None) -> str | None:
-		return _normalize_optional_text(value)
-
 
 class AdminFeedbackAcknowledgeUpdate(BaseModel):
 	assignee: str | None = Field(default=None, max_length=32)
 	ack_deadline: datetime | None = Field(default=None)
-	internal_note: str | None = Field(default=None, max_length=3000)
+	internal_note: TrimmedOptionalText = Field(default=None, max_length=3000)
 
 	@field_validator("assignee", mode="before")
 	@classmethod
@@ -634,11 +612,6 @@ class AdminFeedbackAcknowledgeUpdate(BaseModel):
 			return None
 		return normalize_user_id(value)
 
-	@field_validator("internal_note", mode="before")
-	@classmethod
-	def normalize_internal_note(cls, value: str | None) -> str | None:
-		return _normalize_optional_text(value)
-
 
 class InboxMessageHideCreate(BaseModel):
 	message_kind: str = Field(max_length=24)
@@ -648,7 +621,7 @@ class InboxMessageHideCreate(BaseModel):
 	@classmethod
 	def normalize_message_kind(cls, value: str) -> str:
 		normalized = _normalize_required_text(value, "message_kind").upper()
-		if normalized not in INBOX_MESSAGE_KINDS:
+		if normalized not in INBOX_MESSAGE_KINDS_SET:
 			raise ValueError(f"message_kind must be one of: {', '.join(INBOX_MESSAGE_KINDS)}")
 		return normalized
 
@@ -658,8 +631,8 @@ SEMVER_PATTERN = re.compile(r"^\d+\.\d+\.\d+$")
 
 class ReleaseNoteCreate(BaseModel):
 	version: str = Field(min_length=1, max_length=32)
-	title: str = Field(min_length=1, max_length=120)
-	content: str = Field(min_length=1, max_length=6000)
+	title: TrimmedRequiredText = Field(min_length=1, max_length=120)
+	content: TrimmedRequiredText = Field(min_length=1, max_length=6000)
 	source_feedback_ids: list[int] = Field(default_factory=list)
 
 	@field_validator("version", mode="before")
@@ -670,11 +643,6 @@ class ReleaseNoteCreate(BaseModel):
 			raise ValueError("version must match semantic version format: x.y.z")
 		return normalized
 
-	@field_validator("title", "content", mode="before")
-	@classmethod
-	def normalize_required_fields(cls, value: str, info: Any) -> str:
-		return _normalize_required_text(value, info.field_name)
-
 	@field_validator("source_feedback_ids")
 	@classmethod
 	def validate_source_feedback_ids(cls, value: list[int]) -> list[int]:
@@ -726,25 +694,23 @@ class ReleaseNoteDeliveryRead(UtcTimestampResponseModel):
 
 
 class SecurityHoldingCreate(BaseModel):
-	symbol: str = Field(min_length=1, max_length=32)
-	name: str = Field(min_length=1, max_length=120)
+	symbol: Symbol32
+	name: Name120
 	quantity: Decimal
-	fallback_currency: str = Field(default="CNY", min_length=3, max_length=8)
+	fallback_currency: Currency8 = "CNY"
 	cost_basis_price: Decimal | None = None
 	market: str = Field(default="OTHER", min_length=2, max_length=16)
-	broker: Optional[str] = Field(default=None, max_length=120)
+	broker: TrimmedOptionalText = Field(default=None, max_length=120)
 	started_on: Optional[date] = None
-	note: Optional[str] = Field(default=None, max_length=500)
+	note: TrimmedOptionalText = Field(default=None, max_length=500)
 
-	@field_validator("market", mode="before")
-	@classmethod
-	def validate_market(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, SECURITY_MARKETS, "market")
+	validate_market = field_validator("market", mode="before")(
+		classmethod(_make_choice_validator(SECURITY_MARKETS_SET, SECURITY_MARKETS, "market")),
+	)
 
-	@field_validator("fallback_currency", mode="before")
-	@classmethod
-	def validate_fallback_currency(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, SUPPORTED_CURRENCIES, "fallback_currency")
+	validate_fallback_currency = field_validator("fallback_currency", mode="before")(
+		classmethod(_make_choice_validator(SUPPORTED_CURRENCIES_SET, SUPPORTED_CURRENCIES, "fallback_currency")),
+	)
 
 	@field_validator("quantity", mode="before")
 	@classmethod
@@ -756,14 +722,9 @@ class SecurityHoldingCreate(BaseModel):
 	def normalize_cost_basis_price(cls, value: Any) -> Decimal | None:
 		return _normalize_optional_positive_decimal(value, "持仓成本价")
 
-	@field_validator("broker", "note", mode="before")
-	@classmethod
-	def normalize_optional_fields(cls, value: str | None) -> str | None:
-		return _normalize_optional_text(value)
-
 	@model_validator(mode="after")
 	def validate_quantity_for_market(self) -> SecurityHoldingCreate:
-		if self.market not in {"FUND", "CRYPTO"} and not is_integral_decimal(self.quantity):
+		if self.market not in _FRACTIONAL_MARKETS and not is_integral_decimal(self.quantity):
 			raise ValueError("股票请使用整数数量，基金可使用份额。")
 		return self
 
@@ -774,8 +735,8 @@ class SecurityHoldingUpdate(BaseModel):
 	quantity: Decimal | None = None
 	cost_basis_price: Decimal | None = None
 	started_on: Optional[date] = None
-	broker: Optional[str] = Field(default=None, max_length=120)
-	note: Optional[str] = Field(default=None, max_length=500)
+	broker: TrimmedOptionalText = Field(default=None, max_length=120)
+	note: TrimmedOptionalText = Field(default=None, max_length=500)
 
 	@field_validator("quantity", mode="before")
 	@classmethod
@@ -787,11 +748,6 @@ class SecurityHoldingUpdate(BaseModel):
 	def normalize_cost_basis_price(cls, value: Any) -> Decimal | None:
 		return _normalize_optional_positive_decimal(value, "持仓成本价")
 
-	@field_validator("broker", "note", mode="before")
-	@classmethod
-	def normalize_optional_fields(cls, value: str | None) -> str | None:
-		return _normalize_optional_text(value)
-
 
 class SecurityHoldingRead(UtcTimestampResponseModel):
 	id: int
@@ -813,34 +769,31 @@ class SecurityHoldingRead(UtcTimestampResponseModel):
 
 class SecurityHoldingTransactionCreate(BaseModel):
 	side: str = Field(default="BUY", min_length=3, max_length=12)
-	symbol: str = Field(min_length=1, max_length=32)
-	name: str = Field(min_length=1, max_length=120)
+	symbol: Symbol32
+	name: Name120
 	quantity: Decimal
 	price: Decimal | None = None
-	fallback_currency: str = Field(default="CNY", min_length=3, max_length=8)
+	fallback_currency: Currency8 = "CNY"
 	market: str = Field(default="OTHER", min_length=2, max_length=16)
-	broker: Optional[str] = Field(default=None, max_length=120)
+	broker: TrimmedOptionalText = Field(default=None, max_length=120)
 	traded_on: date
-	note: Optional[str] = Field(default=None, max_length=500)
+	note: TrimmedOptionalText = Field(default=None, max_length=500)
 	sell_proceeds_handling: Optional[str] = Field(default=None, min_length=7, max_length=32)
 	sell_proceeds_account_id: Optional[int] = Field(default=None, ge=1)
 	buy_funding_handling: Optional[str] = Field(default=None, min_length=10, max_length=32)
 	buy_funding_account_id: Optional[int] = Field(default=None, ge=1)
 
-	@field_validator("side", mode="before")
-	@classmethod
-	def validate_side(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, HOLDING_TRANSACTION_SIDES, "side")
+	validate_side = field_validator("side", mode="before")(
+		classmethod(_make_choice_validator(HOLDING_TRANSACTION_SIDES_SET, HOLDING_TRANSACTION_SIDES, "side")),
+	)
 
-	@field_validator("market", mode="before")
-	@classmethod
-	def validate_market(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, SECURITY_MARKETS, "market")
+	validate_market = field_validator("market", mode="before")(
+		classmethod(_make_choice_validator(SECURITY_MARKETS_SET, SECURITY_MARKETS, "market")),
+	)
 
-	@field_validator("fallback_currency", mode="before")
-	@classmethod
-	def validate_fallback_currency(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, SUPPORTED_CURRENCIES, "fallback_currency")
+	validate_fallback_currency = field_validator("fallback_currency", mode="before")(
+		classmethod(_make_choice_validator(SUPPORTED_CURRENCIES_SET, SUPPORTED_CURRENCIES, "fallback_currency")),
+	)
 
 	@field_validator("quantity", mode="before")
 	@classmethod
@@ -852,24 +805,17 @@ class SecurityHoldingTransactionCreate(BaseModel):
 	def normalize_price(cls, value: Any) -> Decimal | None:
 		return _normalize_optional_positive_decimal(value, "成交价格")
 
-	@field_validator("sell_proceeds_handling", mode="before")
-	@classmethod
-	def validate_sell_proceeds_handling(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, SELL_PROCEEDS_HANDLINGS, "sell_proceeds_handling")
+	validate_sell_proceeds_handling = field_validator("sell_proceeds_handling", mode="before")(
+		classmethod(_make_choice_validator(SELL_PROCEEDS_HANDLINGS_SET, SELL_PROCEEDS_HANDLINGS, "sell_proceeds_handling")),
+	)
 
-	@field_validator("buy_funding_handling", mode="before")
-	@classmethod
-	def validate_buy_funding_handling(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, BUY_FUNDING_HANDLINGS, "buy_funding_handling")
-
-	@field_validator("broker", "note", mode="before")
-	@classmethod
-	def normalize_optional_fields(cls, value: str | None) -> str | None:
-		return _normalize_optional_text(value)
+	validate_buy_funding_handling = field_validator("buy_funding_handling", mode="before")(
+		classmethod(_make_choice_validator(BUY_FUNDING_HANDLINGS_SET, BUY_FUNDING_HANDLINGS, "buy_funding_handling")),
+	)
 
 	@model_validator(mode="after")
 	def validate_quantity_for_market(self) -> SecurityHoldingTransactionCreate:
-		if self.market not in {"FUND", "CRYPTO"} and not is_integral_decimal(self.quantity):
+		if self.market not in _FRACTIONAL_MARKETS and not is_integral_decimal(self.quantity):
 			raise ValueError("股票请使用整数数量，基金可使用份额。")
 
 		if self.side == "BUY":
@@ -900,25 +846,18 @@ class SecurityHoldingTransactionCreate(BaseModel):
 class SecurityHoldingTransactionUpdate(BaseModel):
 	model_config = ConfigDict(extra="forbid")
 
-	name: Optional[str] = Field(default=None, min_length=1, max_length=120)
+	name: Optional[Name120] = None
 	quantity: Decimal | None = None
 	price: Decimal | None = None
-	fallback_currency: Optional[str] = Field(default=None, min_length=3, max_length=8)
-	broker: Optional[str] = Field(default=None, max_length=120)
+	fallback_currency: Optional[Currency8] = None
+	broker: TrimmedOptionalText = Field(default=None, max_length=120)
 	traded_on: Optional[date] = None
-	note: Optional[str] = Field(default=None, max_length=500)
+	note: TrimmedOptionalText = Field(default=None, max_length=500)
 	sell_proceeds_handling: Optional[str] = Field(default=None, min_length=7, max_length=32)
 	sell_proceeds_account_id: Optional[int] = Field(default=None, ge=1)
 	buy_funding_handling: Optional[str] = Field(default=None, min_length=10, max_length=32)
 	buy_funding_account_id: Optional[int] = Field(default=None, ge=1)
 
-	@field_validator("name", mode="before")
-	@classmethod
-	def normalize_name(cls, value: str | None) -> str | None:
-		if value is None:
-			return None
-		return _normalize_required_text(value, "name")
-
 	@field_validator("quantity", mode="before")
 	@classmethod
 	def normalize_quantity(cls, value: Any) -> Decimal | None:
@@ -929,25 +868,17 @@ class SecurityHoldingTransactionUpdate(BaseModel):
 	def normalize_price(cls, value: Any) -> Decimal | None:
 		return _normalize_optional_positive_decimal(value, "成交价格")
 
-	@field_validator("sell_proceeds_handling", mode="before")
-	@classmethod
-	def validate_sell_proceeds_handling(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, SELL_PROCEEDS_HANDLINGS, "sell_proceeds_handling")
-
-	@field_validator("fallback_currency", mode="before")
-	@classmethod
-	def validate_fallback_currency(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, SUPPORTED_CURRENCIES, "fallback_currency")
+	validate_sell_proceeds_handling = field_validator("sell_proceeds_handling", mode="before")(
+		classmethod(_make_choice_validator(SELL_PROCEEDS_HANDLINGS_SET, SELL_PROCEEDS_HANDLINGS, "sell_proceeds_handling")),
+	)
 
-	@field_validator("buy_funding_handling", mode="before")
-	@classmethod
-	def validate_buy_funding_handling(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, BUY_FUNDING_HANDLINGS, "buy_funding_handling")
+	validate_fallback_currency = field_validator("fallback_currency", mode="before")(
+		classmethod(_make_choice_validator(SUPPORTED_CURRENCIES_SET, SUPPORTED_CURRENCIES, "fallback_currency")),
+	)
 
-	@field_validator("broker", "note", mode="before")
-	@classmethod
-	def normalize_optional_fields(cls, value: str | None) -> str | None:
-		return _normalize_optional_text(value)
+	validate_buy_funding_handling = field_validator("buy_funding_handling", mode="before")(
+		classmethod(_make_choice_validator(BUY_FUNDING_HANDLINGS_SET, BUY_FUNDING_HANDLINGS, "buy_funding_handling")),
+	)
 
 	@model_validator(mode="after")
 	def validate_sell_proceeds_fields(self) -> SecurityHoldingTransactionUpdate:
@@ -1006,10 +937,9 @@ class CashLedgerEntryRead(UtcTimestampResponseModel):
 	created_at: datetime
 	updated_at: datetime
 
-	@field_validator("entry_type", mode="before")
-	@classmethod
-	def validate_entry_type(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, CASH_LEDGER_ENTRY_TYPES, "entry_type")
+	validate_entry_type = field_validator("entry_type", mode="before")(
+		classmethod(_make_choice_validator(CASH_LEDGER_ENTRY_TYPES_SET, CASH_LEDGER_ENTRY_TYPES, "entry_type")),
+	)
 
 
 class CashTransferCreate(BaseModel):
@@ -1018,7 +948,7 @@ class CashTransferCreate(BaseModel):
 	source_amount: Decimal
 	target_amount: Decimal | None = None
 	transferred_on: date
-	note: Optional[str] = Field(default=None, max_length=500)
+	note: TrimmedOptionalText = Field(default=None, max_length=500)
 
 	@field_validator("source_amount", mode="before")
 	@classmethod
@@ -1030,11 +960,6 @@ class CashTransferCreate(BaseModel):
 	def normalize_target_amount(cls, value: Any) -> Decimal | None:
 		return _normalize_optional_positive_decimal(value, "转入金额")
 
-	@field_validator("note", mode="before")
-	@classmethod
-	def normalize_note(cls, value: str | None) -> str | None:
-		return _normalize_optional_text(value)
-
 	@model_validator(mode="after")
 	def validate_accounts(self) -> CashTransferCreate:
 		if self.from_account_id == self.to_account_id:
@@ -1048,7 +973,7 @@ class CashTransferUpdate(BaseModel):
 	source_amount: Decimal | None = None
 	target_amount: Decimal | None = None
 	transferred_on: date | None = None
-	note: Optional[str] = Field(default=None, max_length=500)
+	note: TrimmedOptionalText = Field(default=None, max_length=500)
 
 	@field_validator("source_amount", mode="before")
 	@classmethod
@@ -1060,11 +985,6 @@ class CashTransferUpdate(BaseModel):
 	def normalize_target_amount(cls, value: Any) -> Decimal | None:
 		return _normalize_optional_positive_decimal(value, "转入金额")
 
-	@field_validator("note", mode="before")
-	@classmethod
-	def normalize_note(cls, value: str | None) -> str | None:
-		return _normalize_optional_text(value)
-
 	@model_validator(mode="after")
 	def validate_accounts(self) -> CashTransferUpdate:
 		if self.from_account_id is not None and self.from_account_id == self.to_account_id:
@@ -1096,34 +1016,24 @@ class CashLedgerAdjustmentCreate(BaseModel):
 	cash_account_id: int = Field(ge=1)
 	amount: Decimal
 	happened_on: date
-	note: Optional[str] = Field(default=None, max_length=500)
+	note: TrimmedOptionalText = Field(default=None, max_length=500)
 
 	@field_validator("amount", mode="before")
 	@classmethod
 	def validate_amount(cls, value: Any) -> Decimal:
 		return _normalize_non_zero_decimal(value, "调整金额")
 
-	@field_validator("note", mode="before")
-	@classmethod
-	def normalize_note(cls, value: str | None) -> str | None:
-		return _normalize_optional_text(value)
-
 
 class CashLedgerAdjustmentUpdate(BaseModel):
 	amount: Decimal | None = None
 	happened_on: date | None = None
-	note: Optional[str] = Field(default=None, max_length=500)
+	note: TrimmedOptionalText = Field(default=None, max_length=500)
 
 	@field_validator("amount", mode="before")
 	@classmethod
 	def validate_amount(cls, value: Any) -> Decimal | None:
 		return _normalize_optional_non_zero_decimal(value, "调整金额")
 
-	@field_validator("note", mode="before")
-	@classmethod
-	def normalize_note(cls, value: str | None) -> str | None:
-		return _normalize_optional_text(value)
-
 
 class CashLedgerAdjustmentApplyRead(UtcTimestampResponseModel):
 	entry: CashLedgerEntryRead
@@ -1134,10 +1044,9 @@ class AgentTaskCreate(BaseModel):
 	task_type: str = Field(min_length=1, max_length=40)
 	payload: dict[str, Any] = Field(default_factory=dict)
 
-	@field_validator("task_type", mode="before")
-	@classmethod
-	def validate_task_type(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, AGENT_TASK_TYPES, "task_type")
+	validate_task_type = field_validator("task_type", mode="before")(
+		classmethod(_make_choice_validator(AGENT_TASK_TYPES_SET, AGENT_TASK_TYPES, "task_type")),
+	)
 
 
 class AgentTaskRead(UtcTimestampResponseModel):
@@ -1154,15 +1063,13 @@ class AgentTaskRead(UtcTimestampResponseModel):
 	updated_at: datetime
 	completed_at: datetime | None = None
 
-	@field_validator("task_type", mode="before")
-	@classmethod
-	def validate_task_type(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, AGENT_TASK_TYPES, "task_type")
+	validate_task_type = field_validator("task_type", mode="before")(
+		classmethod(_make_choice_validator(AGENT_TASK_TYPES_SET, AGENT_TASK_TYPES, "task_type")),
+	)
 
-	@field_validator("status", mode="before")
-	@classmethod
-	def validate_status(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, AGENT_TASK_STATUSES, "status")
+	validate_status = field_validator("status", mode="before")(
+		classmethod(_make_choice_validator(AGENT_TASK_STATUSES_SET, AGENT_TASK_STATUSES, "status")),
+	)
 
 
 class AgentRegistrationRead(UtcTimestampResponseModel):
@@ -1211,6 +1118,8 @@ class ValuedCashAccount(BaseModel):
 
 
 class ValuedHolding(UtcTimestampResponseModel):
+	model_config = ConfigDict(frozen=True, extra="forbid")
+
 	id: int
 	symbol: str
 	name: str
@@ -1266,30 +1175,38 @@ class ValuedOtherAsset(BaseModel):
 
 
 class AllocationSlice(BaseModel):
+	model_config = ConfigDict(frozen=True, extra="forbid")
+
 	label: str
 	value: float
 
 
 class TimelinePoint(BaseModel):
+	model_config = ConfigDict(frozen=True, extra="forbid")
+
 	label: str
 	value: float
 	timestamp_utc: datetime
 	corrected: bool = False
 
 
+# Module-level adapter so timeline builders validate whole point lists in one
+# pydantic-core call instead of constructing models item by item.
+TIMELINE_POINT_LIST_ADAPTER: TypeAdapter[list[TimelinePoint]] = TypeAdapter(list[TimelinePoint])
+
+
 class DashboardCorrectionCreate(BaseModel):
 	series_scope: str = Field(min_length=1, max_length=32)
-	symbol: str | None = Field(default=None, max_length=64)
+	symbol: TrimmedOptionalText = Field(default=None, max_length=64)
 	granularity: str = Field(min_length=3, max_length=8)
 	bucket_utc: datetime
 	action: str = Field(min_length=6, max_length=16)
 	corrected_value: Decimal | None = None
-	reason: str = Field(min_length=1, max_length=500)
+	reason: TrimmedRequiredText = Field(min_length=1, max_length=500)
 
-	@field_validator("series_scope", mode="before")
-	@classmethod
-	def validate_series_scope(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, DASHBOARD_SERIES_SCOPES, "series_scope")
+	validate_series_scope = field_validator("series_scope", mode="before")(
+		classmethod(_make_choice_validator(DASHBOARD_SERIES_SCOPES_SET, DASHBOARD_SERIES_SCOPES, "series_scope")),
+	)
 
 	@field_validator("granularity", mode="before")
 	@classmethod
@@ -1297,21 +1214,15 @@ class DashboardCorrectionCreate(BaseModel):
 		if value is None:
 			return None
 		normalized = value.strip().lower()
-		if normalized not in DASHBOARD_CORRECTION_GRANULARITIES:
+		if normalized not in DASHBOARD_CORRECTION_GRANULARITIES_SET:
 			raise ValueError(
 				f"granularity must be one of: {', '.join(DASHBOARD_CORRECTION_GRANULARITIES)}.",
 			)
 		return normalized
 
-	@field_validator("action", mode="before")
-	@classmethod
-	def validate_action(cls, value: str | None) -> str | None:
-		return _normalize_choice(value, DASHBOARD_CORRECTION_ACTIONS, "action")
-
-	@field_validator("symbol", "reason", mode="before")
-	@classmethod
-	def normalize_optional_fields(cls, value: str | None) -> str | None:
-		return _normalize_optional_text(value)
+	validate_action = field_validator("action", mode="before")(
+		classmethod(_make_choice_validator(DASHBOARD_CORRECTION_ACTIONS_SET, DASHBOARD_CORRECTION_ACTIONS, "action")),
+	)
 
 	@field_validator("corrected_value", mode="before")
 	@classmethod
@@ -1382,6 +1293,8 @@ class AssetRecordRead(UtcTimestampResponseModel):
 
 
 class HoldingReturnSeries(BaseModel):
+	model_config = ConfigDict(frozen=True, extra="forbid")
+
 	symbol: str
 	name: str
 	quantity: float
@@ -1426,6 +1339,11 @@ class DashboardResponse(BaseModel):
 	warnings: list[str]
 
 
+# Cached Rust serializer for the bulky dashboard payload; the endpoint dumps
+# through this instead of letting FastAPI re-validate the whole tree per request.
+DASHBOARD_RESPONSE_ADAPTER: TypeAdapter[DashboardResponse] = TypeAdapter(DashboardResponse)
+
+
 class AgentContextRead(UtcTimestampResponseModel):
 	user_id: str
 	generated_at: datetime
@@ -1444,3 +1362,18 @@ class AgentContextRead(UtcTimestampResponseModel):
 	recent_holding_transactions: list[SecurityHoldingTransactionRead]
 	pending_history_sync_requests: int
 	warnings: list[str]
+
+
+# ``from __future__ import annotations`` leaves every annotation as a string,
+# so any model whose references could not be resolved at class creation would
+# otherwise build its validator lazily on the first request. Rebuild them all
+# here so that cost is paid once at import; for already-complete models this
+# is a cheap no-op.
+for _schema_model in list(vars().values()):
+	if (
+		isinstance(_schema_model, type)
+		and issubclass(_schema_model, BaseModel)
+		and _schema_model is not BaseModel
+	):
+		_schema_model.model_rebuild()
+del _schema_model
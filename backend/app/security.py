@@ -5,11 +5,15 @@ import hmac
 import os
 import re
 import secrets
+from functools import lru_cache
+
 from fastapi import HTTPException, Request
 
 from app.settings import get_settings
 
-USERNAME_PATTERN = re.compile(r"^[a-z0-9_]{3,32}$")
+USERNAME_ALLOWED_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_")
+USERNAME_MIN_LENGTH = 3
+USERNAME_MAX_LENGTH = 32
 EMAIL_PATTERN = re.compile(r"^[^\s@]+@[^\s@]+\.[^\s@]+$")
 PASSWORD_MIN_LENGTH = 8
 PASSWORD_MAX_LENGTH = 128
@@ -19,11 +23,17 @@ SCRYPT_R = 8
 SCRYPT_P = 1
 SCRYPT_DKLEN = 64
 AGENT_TOKEN_PREFIX = "sk-"
+_PASSWORD_DIGEST_PREFIX = f"{PASSWORD_SCHEME}${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}$"
 
 
 def normalize_user_id(value: str) -> str:
+	# The username alphabet is a flat character set, so a length check plus a
+	# frozenset superset test beats spinning up the regex engine per login.
 	user_id = value.strip().lower()
-	if not USERNAME_PATTERN.fullmatch(user_id):
+	if not (
+		USERNAME_MIN_LENGTH <= len(user_id) <= USERNAME_MAX_LENGTH
+		and USERNAME_ALLOWED_CHARS.issuperset(user_id)
+	):
 		raise ValueError("用户名仅支持 3-32 位小写字母、数字和下划线。")
 	return user_id
 
@@ -44,11 +54,16 @@ def normalize_email(value: str) -> str:
 	return email
 
 
+@lru_cache(maxsize=1)
+def _email_pepper_bytes() -> bytes:
+	# The pepper is immutable after startup; encode it once instead of per call.
+	return get_settings().email_pepper_value().encode("utf-8")
+
+
 def hash_email(email: str) -> str:
 	normalized_email = normalize_email(email)
-	pepper = get_settings().email_pepper_value().encode("utf-8")
 	return hmac.new(
-		pepper,
+		_email_pepper_bytes(),
 		normalized_email.encode("utf-8"),
 		hashlib.sha256,
 	).hexdigest()
@@ -77,10 +92,7 @@ def hash_password(password: str) -> str:
 		p=SCRYPT_P,
 		dklen=SCRYPT_DKLEN,
 	)
-	return (
-		f"{PASSWORD_SCHEME}${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}"
-		f"${salt.hex()}${derived_key.hex()}"
-	)
+	return f"{_PASSWORD_DIGEST_PREFIX}{salt.hex()}${derived_key.hex()}"
 
 
 def verify_password(password: str, password_digest: str) -> bool:
@@ -88,18 +100,19 @@ def verify_password(password: str, password_digest: str) -> bool:
 		scheme, n, r, p, salt_hex, expected_hex = password_digest.split("$", maxsplit=5)
 		if scheme != PASSWORD_SCHEME:
 			return False
+		expected_key = bytes.fromhex(expected_hex)
 		derived_key = hashlib.scrypt(
 			validate_password_strength(password).encode("utf-8"),
 			salt=bytes.fromhex(salt_hex),
 			n=int(n),
 			r=int(r),
 			p=int(p),
-			dklen=len(bytes.fromhex(expected_hex)),
+			dklen=len(expected_key),
 		)
 	except (ValueError, TypeError):
 		return False
 
-	return hmac.compare_digest(derived_key.hex(), expected_hex)
+	return hmac.compare_digest(derived_key, expected_key)
 
 
 def generate_agent_token() -> str:
@@ -101,11 +101,8 @@ def create_fixed_asset(
 		after_state=_capture_model_state(asset),
 	)
 	job_service.enqueue_user_portfolio_snapshot_rebuild(session, current_user.username)
-	session.commit()
-	session.refresh(asset)
-	_invalidate_dashboard_cache(current_user.username)
 	value_cny = display_money(asset.current_value_cny)
-	return FixedAssetRead(
+	response = FixedAssetRead(
 		id=asset.id or 0,
 		name=asset.name,
 		category=asset.category,
@@ -118,6 +115,9 @@ def create_fixed_asset(
 		value_cny=decimal_to_float(value_cny),
 		return_pct=decimal_to_float(_calculate_return_pct(value_cny, asset.purchase_value_cny)),
 	)
+	session.commit()
+	_invalidate_dashboard_cache(current_user.username)
+	return response
 
 def update_fixed_asset(
 	asset_id: int,
@@ -150,11 +150,8 @@ def update_fixed_asset(
 		after_state=_capture_model_state(asset),
 	)
 	job_service.enqueue_user_portfolio_snapshot_rebuild(session, current_user.username)
-	session.commit()
-	session.refresh(asset)
-	_invalidate_dashboard_cache(current_user.username)
 	value_cny = display_money(asset.current_value_cny)
-	return FixedAssetRead(
+	response = FixedAssetRead(
 		id=asset.id or 0,
 		name=asset.name,
 		category=asset.category,
@@ -167,6 +164,9 @@ def update_fixed_asset(
 		value_cny=decimal_to_float(value_cny),
 		return_pct=decimal_to_float(_calculate_return_pct(value_cny, asset.purchase_value_cny)),
 	)
+	session.commit()
+	_invalidate_dashboard_cache(current_user.username)
+	return response
 
 def delete_fixed_asset(
 	asset_id: int,
@@ -254,10 +254,10 @@ def create_liability(
 		after_state=_capture_model_state(entry),
 	)
 	job_service.enqueue_user_portfolio_snapshot_rebuild(session, current_user.username)
+	response = _to_liability_read(entry)
 	session.commit()
-	session.refresh(entry)
 	_invalidate_dashboard_cache(current_user.username)
-	return _to_liability_read(entry)
+	return response
 
 def update_liability(
 	entry_id: int,
@@ -291,10 +291,10 @@ def update_liability(
 		after_state=_capture_model_state(entry),
 	)
 	job_service.enqueue_user_portfolio_snapshot_rebuild(session, current_user.username)
+	response = _to_liability_read(entry)
 	session.commit()
-	session.refresh(entry)
 	_invalidate_dashboard_cache(current_user.username)
-	return _to_liability_read(entry)
+	return response
 
 def delete_liability(
 	entry_id: int,
@@ -386,11 +386,8 @@ def create_other_asset(
 		after_state=_capture_model_state(asset),
 	)
 	job_service.enqueue_user_portfolio_snapshot_rebuild(session, current_user.username)
-	session.commit()
-	session.refresh(asset)
-	_invalidate_dashboard_cache(current_user.username)
 	value_cny = display_money(asset.current_value_cny)
-	return OtherAssetRead(
+	response = OtherAssetRead(
 		id=asset.id or 0,
 		name=asset.name,
 		category=asset.category,
@@ -403,6 +400,9 @@ def create_other_asset(
 		value_cny=decimal_to_float(value_cny),
 		return_pct=decimal_to_float(_calculate_return_pct(value_cny, asset.original_value_cny)),
 	)
+	session.commit()
+	_invalidate_dashboard_cache(current_user.username)
+	return response
 
 def update_other_asset(
 	asset_id: int,
@@ -435,11 +435,8 @@ def update_other_asset(
 		after_state=_capture_model_state(asset),
 	)
 	job_service.enqueue_user_portfolio_snapshot_rebuild(session, current_user.username)
-	session.commit()
-	session.refresh(asset)
-	_invalidate_dashboard_cache(current_user.username)
 	value_cny = display_money(asset.current_value_cny)
-	return OtherAssetRead(
+	response = OtherAssetRead(
 		id=asset.id or 0,
 		name=asset.name,
 		category=asset.category,
@@ -452,6 +449,9 @@ def update_other_asset(
 		value_cny=decimal_to_float(value_cny),
 		return_pct=decimal_to_float(_calculate_return_pct(value_cny, asset.original_value_cny)),
 	)
+	session.commit()
+	_invalidate_dashboard_cache(current_user.username)
+	return response
 
 def delete_other_asset(
 	asset_id: int,
@@ -648,7 +648,6 @@ def _create_user_account(
 	)
 	session.add(user)
 	session.commit()
-	session.refresh(user)
 	return user
 
 
@@ -13,6 +13,8 @@ CacheValue = TypeVar("CacheValue")
 
 @dataclass(slots=True)
 class CacheEntry(Generic[CacheValue]):
+	"""Pickled into Redis by RedisBackedTTLCache; keep for stored-entry compatibility."""
+
 	value: CacheValue
 	expires_at: float
 
@@ -21,28 +23,27 @@ class TTLCache(Generic[CacheValue]):
 	"""Store values in-process while retaining the last stale value for fallback."""
 
 	def __init__(self, now: Callable[[], float] | None = None) -> None:
-		self._entries: dict[str, CacheEntry[CacheValue]] = {}
+		# Entries are plain (expires_at, value) tuples; cache hits skip the
+		# dataclass attribute lookups on this hot path. clear() empties the
+		# dict in place, so the bound .get stays valid for the cache lifetime.
+		self._entries: dict[str, tuple[float, CacheValue]] = {}
+		self._get_entry = self._entries.get
 		self._now = now or monotonic
 
 	def get(self, key: str) -> CacheValue | None:
-		entry = self._entries.get(key)
-		if entry is None:
+		entry = self._get_entry(key)
+		if entry is None or entry[0] <= self._now():
 			return None
-		if entry.expires_at <= self._now():
-			return None
-		return entry.value
+		return entry[1]
 
 	def get_stale(self, key: str) -> CacheValue | None:
-		entry = self._entries.get(key)
+		entry = self._get_entry(key)
 		if entry is None:
 			return None
-		return entry.value
+		return entry[1]
 
 	def set(self, key: str, value: CacheValue, ttl_seconds: float) -> CacheValue:
-		self._entries[key] = CacheEntry(
-			value=value,
-			expires_at=self._now() + ttl_seconds,
-		)
+		self._entries[key] = (self._now() + ttl_seconds, value)
 		return value
 
 	def clear(self) -> None:
@@ -51,8 +52,8 @@ class TTLCache(Generic[CacheValue]):
 	def expire_all(self) -> None:
 		"""Mark every entry expired while keeping stale values available for fallback."""
 		now = self._now()
-		for entry in self._entries.values():
-			entry.expires_at = now
+		for key, entry in self._entries.items():
+			self._entries[key] = (now, entry[1])
 
 
 class RedisBackedTTLCache(Generic[CacheValue]):
@@ -178,12 +178,12 @@ async def list_accounts(
 	for account in accounts:
 		valued_account = valued_account_map.get(account.id or 0)
 		items.append(
-			CashAccountRead(
+			CashAccountRead.model_construct(
 				id=account.id or 0,
 				name=account.name,
 				platform=account.platform,
 				currency=account.currency,
-				balance=account.balance,
+				balance=decimal_to_float(account.balance),
 				account_type=account.account_type,
 				started_on=account.started_on,
 				note=account.note,
@@ -254,10 +254,57 @@ def create_account(
 		after_state=_capture_model_state(account),
 	)
 	job_service.enqueue_user_portfolio_snapshot_rebuild(session, current_user.username)
+	response = _to_cash_account_read(account)
 	session.commit()
-	session.refresh(account)
 	_invalidate_dashboard_cache(current_user.username)
-	return _to_cash_account_read(account)
+	return response
+
+def create_accounts_bulk(
+	payloads: list[CashAccountCreate],
+	current_user: CurrentUserDependency,
+	session: SessionDependency,
+) -> list[CashAccountRead]:
+	"""Create many cash accounts in one transaction instead of one commit per row."""
+	if not payloads:
+		raise HTTPException(status_code=422, detail="至少需要一条现金账户记录。")
+	if len(payloads) > 200:
+		raise HTTPException(status_code=422, detail="单次批量创建最多支持 200 条现金账户记录。")
+
+	accounts: list[CashAccount] = []
+	for payload in payloads:
+		account = CashAccount(
+			user_id=current_user.username,
+			name=payload.name.strip(),
+			platform=payload.platform.strip(),
+			currency=_normalize_currency(payload.currency),
+			balance=DECIMAL_ZERO,
+			account_type=payload.account_type,
+			started_on=payload.started_on,
+			note=payload.note,
+		)
+		session.add(account)
+		accounts.append(account)
+	session.flush()
+	for payload, account in zip(payloads, accounts):
+		_reconcile_cash_account_initial_ledger_entry(
+			session,
+			account=account,
+			target_balance=payload.balance,
+		)
+		_record_asset_mutation(
+			session,
+			current_user,
+			entity_type="CASH_ACCOUNT",
+			entity_id=account.id,
+			operation="CREATE",
+			before_state=None,
+			after_state=_capture_model_state(account),
+			reason="BULK_CREATE",
+		)
+	job_service.enqueue_user_portfolio_snapshot_rebuild(session, current_user.username)
+	session.commit()
+	_invalidate_dashboard_cache(current_user.username)
+	return [_to_cash_account_read(account) for account in accounts]
 
 def update_account(
 	account_id: int,
@@ -312,10 +359,10 @@ def update_account(
 		after_state=_capture_model_state(account),
 	)
 	job_service.enqueue_user_portfolio_snapshot_rebuild(session, current_user.username)
+	response = _to_cash_account_read(account)
 	session.commit()
-	session.refresh(account)
 	_invalidate_dashboard_cache(current_user.username)
-	return _to_cash_account_read(account)
+	return response
 
 def delete_account(
 	account_id: int,
@@ -996,4 +1043,4 @@ def delete_cash_transfer(
 	_invalidate_dashboard_cache(current_user.username)
 	return Response(status_code=204)
 
-__all__ = ['list_asset_mutation_audits', 'list_accounts', 'create_account', 'update_account', 'delete_account', 'list_cash_ledger_entries', 'create_cash_ledger_adjustment', 'update_cash_ledger_adjustment', 'delete_cash_ledger_adjustment', 'list_cash_transfers', 'create_cash_transfer', 'update_cash_transfer', 'delete_cash_transfer']
+__all__ = ['list_asset_mutation_audits', 'list_accounts', 'create_account', 'create_accounts_bulk', 'update_account', 'delete_account', 'list_cash_ledger_entries', 'create_cash_ledger_adjustment', 'update_cash_ledger_adjustment', 'delete_cash_ledger_adjustment', 'list_cash_transfers', 'create_cash_transfer', 'update_cash_transfer', 'delete_cash_transfer']
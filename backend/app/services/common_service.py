@@ -5,6 +5,7 @@ from decimal import Decimal
 from datetime import date, datetime, timedelta, timezone
 import hashlib
 import json
+import sys
 from typing import Any
 from zoneinfo import ZoneInfo
 
@@ -105,7 +106,10 @@ def _load_idempotent_response(
 		return None
 	if record.request_hash != request_hash:
 		raise HTTPException(status_code=409, detail="同一幂等键对应的请求参数不一致。")
-	return response_model.model_validate(json.loads(record.response_json))
+	# model_validate_json parses and validates in one pydantic-core pass,
+	# reusing the model's compiled validator instead of building an
+	# intermediate dict with the stdlib json module first.
+	return response_model.model_validate_json(record.response_json)
 
 def _store_idempotent_response(
 	session: Session,
@@ -156,7 +160,9 @@ def _store_idempotent_response(
 	session.add(record)
 
 def _normalize_currency(code: str) -> str:
-	return code.strip().upper()
+	# Interned so the handful of distinct codes share one object per value
+	# and FX-rate dict lookups compare by pointer first.
+	return sys.intern(code.strip().upper())
 
 def _normalize_symbol(symbol: str, market: str | None = None) -> str:
 	try:
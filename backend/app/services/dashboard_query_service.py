@@ -1,6 +1,8 @@
 from __future__ import annotations
+import asyncio
 from datetime import datetime, timedelta
 from decimal import Decimal
+import logging
 from typing import Any
 from fastapi import HTTPException, Query
 from fastapi.responses import Response
@@ -15,6 +17,7 @@ from app.models import (
     LiabilityEntry,
     OtherAsset,
     PortfolioSnapshot,
+    PortfolioSnapshotRollup,
     RealtimeHoldingPerformanceSnapshot,
     RealtimePortfolioSnapshot,
     SecurityHolding,
@@ -28,6 +31,7 @@ from app.runtime_state import (
 	LivePortfolioState,
 )
 from app.schemas import (
+	DASHBOARD_RESPONSE_ADAPTER,
 	AllocationSlice,
 	DashboardCorrectionCreate,
 	DashboardCorrectionRead,
@@ -47,7 +51,7 @@ from app.services.common_service import (
     _is_current_second,
     _server_today_date,
 )
-from app.fixed_precision import DECIMAL_ZERO, display_money
+from app.fixed_precision import DECIMAL_ZERO, decimal_to_float, display_money
 from app.services.history_sync_service import _has_holding_history_sync_pending
 from app.services.dashboard_correction_service import (
 	_apply_dashboard_corrections,
@@ -75,6 +79,10 @@ from app.services.portfolio_service import (
 from app.services import service_context
 from app.services.service_context import SessionDependency
 
+logger = logging.getLogger(__name__)
+
+_dashboard_refresh_tasks: dict[str, asyncio.Task[None]] = {}
+
 async def _refresh_user_dashboards(
 	session: Session,
 	users: list[UserAccount],
@@ -111,6 +119,58 @@ def _load_series_with_live_snapshot(
 		snapshots.append(live_snapshot)
 	return snapshots
 
+def _load_rollup_series(
+	session: Session,
+	user_id: str,
+	granularity: str,
+	since: datetime,
+) -> list[PortfolioSnapshot]:
+	rollups = list(
+		session.exec(
+			select(PortfolioSnapshotRollup)
+			.where(PortfolioSnapshotRollup.user_id == user_id)
+			.where(PortfolioSnapshotRollup.granularity == granularity)
+			.where(PortfolioSnapshotRollup.bucket_start_utc >= since)
+			.order_by(PortfolioSnapshotRollup.bucket_start_utc.asc()),
+		),
+	)
+	# Snapshots recorded before the rollups were introduced have no rollup
+	# rows; cover the older part of the window from the raw table.
+	fallback_query = (
+		select(PortfolioSnapshot)
+		.where(PortfolioSnapshot.user_id == user_id)
+		.where(PortfolioSnapshot.created_at >= since)
+	)
+	if rollups:
+		fallback_query = fallback_query.where(
+			PortfolioSnapshot.created_at < rollups[0].bucket_start_utc,
+		)
+	series = list(
+		session.exec(fallback_query.order_by(PortfolioSnapshot.created_at.asc())),
+	)
+	series.extend(
+		PortfolioSnapshot(
+			user_id=rollup.user_id,
+			total_value_cny=rollup.total_value_cny,
+			created_at=rollup.bucket_start_utc,
+		)
+		for rollup in rollups
+	)
+	return series
+
+def _load_rollup_series_with_live_snapshot(
+	session: Session,
+	user_id: str,
+	granularity: str,
+	since: datetime,
+	*,
+	live_snapshot: PortfolioSnapshot | None = None,
+) -> list[PortfolioSnapshot]:
+	snapshots = _load_rollup_series(session, user_id, granularity, since)
+	if live_snapshot is not None and live_snapshot.created_at >= _coerce_utc_datetime(since):
+		snapshots.append(live_snapshot)
+	return snapshots
+
 def _load_realtime_portfolio_series(
 	session: Session,
 	user_id: str,
@@ -385,27 +445,32 @@ async def _build_dashboard(session: Session, user: UserAccount) -> DashboardResp
 		"hour",
 	)
 	day_series_raw = build_timeline(
-		_load_series_with_live_snapshot(
+		_load_rollup_series_with_live_snapshot(
 			session,
 			user_id,
+			"day",
 			now - timedelta(days=30),
 			live_snapshot=live_portfolio_snapshot,
 		),
 		"day",
 	)
 	month_series_raw = build_timeline(
-		_load_series_with_live_snapshot(
+		_load_rollup_series_with_live_snapshot(
 			session,
 			user_id,
+			"month",
 			now - timedelta(days=366),
 			live_snapshot=live_portfolio_snapshot,
 		),
 		"month",
 	)
+	# Year buckets reduce from the monthly rollups: the latest month in each
+	# year carries that year's closing value.
 	year_series_raw = build_timeline(
-		_load_series_with_live_snapshot(
+		_load_rollup_series_with_live_snapshot(
 			session,
 			user_id,
+			"month",
 			now - timedelta(days=366 * 5),
 			live_snapshot=live_portfolio_snapshot,
 		),
@@ -595,10 +660,10 @@ async def _build_dashboard(session: Session, user: UserAccount) -> DashboardResp
 		)
 
 		holding_return_series.append(
-			HoldingReturnSeries(
+			HoldingReturnSeries.model_construct(
 				symbol=holding.symbol,
 				name=holding.name,
-				quantity=holding.quantity,
+				quantity=decimal_to_float(holding.quantity),
 				second_series=build_return_timeline(
 					_load_hybrid_holdings_return_series_with_live_snapshot(
 						session,
@@ -671,23 +736,25 @@ async def _build_dashboard(session: Session, user: UserAccount) -> DashboardResp
 		*liability_warnings,
 	]
 
-	return DashboardResponse(
+	# The response fields are already display-normalized, so skip pydantic
+	# validation and build the payload tree with model_construct.
+	return DashboardResponse.model_construct(
 		server_today=_server_today_date(now),
-		total_value_cny=total_value_cny,
-		cash_value_cny=cash_value_cny,
-		holdings_value_cny=holdings_value_cny,
-		fixed_assets_value_cny=fixed_assets_value_cny,
-		liabilities_value_cny=liabilities_value_cny,
-		other_assets_value_cny=other_assets_value_cny,
-		usd_cny_rate=usd_cny_rate,
-		hkd_cny_rate=hkd_cny_rate,
+		total_value_cny=decimal_to_float(total_value_cny),
+		cash_value_cny=decimal_to_float(cash_value_cny),
+		holdings_value_cny=decimal_to_float(holdings_value_cny),
+		fixed_assets_value_cny=decimal_to_float(fixed_assets_value_cny),
+		liabilities_value_cny=decimal_to_float(liabilities_value_cny),
+		other_assets_value_cny=decimal_to_float(other_assets_value_cny),
+		usd_cny_rate=decimal_to_float(usd_cny_rate),
+		hkd_cny_rate=decimal_to_float(hkd_cny_rate),
 		cash_accounts=valued_accounts,
 		holdings=valued_holdings,
 		fixed_assets=valued_fixed_assets,
 		liabilities=valued_liabilities,
 		other_assets=valued_other_assets,
 		allocation=[
-			AllocationSlice(label=label, value=value)
+			AllocationSlice.model_construct(label=label, value=decimal_to_float(value))
 			for label, value in (
 				("现金", cash_value_cny),
 				("投资类", holdings_value_cny),
@@ -713,6 +780,36 @@ async def _build_dashboard(session: Session, user: UserAccount) -> DashboardResp
 		warnings=_filter_dashboard_warnings_for_user(dashboard_warnings, user),
 	)
 
+async def _refresh_dashboard_cache(user: UserAccount) -> None:
+	from app.database import engine
+
+	with Session(engine) as owned_session:
+		refreshed_user = owned_session.get(UserAccount, user.username) or user
+		await _get_cached_dashboard(owned_session, refreshed_user, force_refresh=True)
+
+def _ensure_dashboard_refresh(user: UserAccount) -> None:
+	"""Schedule at most one in-flight background dashboard rebuild per user."""
+	existing_task = _dashboard_refresh_tasks.get(user.username)
+	if existing_task is not None and not existing_task.done():
+		return
+
+	refresh_task = asyncio.create_task(
+		_refresh_dashboard_cache(user),
+		name=f"dashboard-refresh:{user.username}",
+	)
+
+	def cleanup(task: asyncio.Task[None]) -> None:
+		_dashboard_refresh_tasks.pop(user.username, None)
+		try:
+			task.result()
+		except asyncio.CancelledError:
+			return
+		except Exception:
+			logger.exception("Background dashboard refresh crashed for %s", user.username)
+
+	refresh_task.add_done_callback(cleanup)
+	_dashboard_refresh_tasks[user.username] = refresh_task
+
 async def _get_cached_dashboard(
 	session: Session,
 	user: UserAccount,
@@ -720,11 +817,11 @@ async def _get_cached_dashboard(
 ) -> DashboardResponse:
 	cache_entry = runtime_state.dashboard_cache.get(user.username)
 
-	if (
-		not force_refresh
-		and cache_entry is not None
-		and _is_current_second(cache_entry.generated_at)
-	):
+	if not force_refresh and cache_entry is not None:
+		# Stale-while-revalidate: serve the cached dashboard immediately and
+		# rebuild off the request path when the entry is past its second.
+		if not _is_current_second(cache_entry.generated_at):
+			_ensure_dashboard_refresh(user)
 		return cache_entry.dashboard
 
 	async with runtime_state.async_redis_lock(
@@ -754,7 +851,7 @@ async def get_dashboard(
 	current_user: CurrentUserDependency,
 	session: SessionDependency,
 	refresh: bool = False,
-) -> DashboardResponse:
+) -> Response:
 	from app.services import dashboard_service
 
 	if refresh:
@@ -767,10 +864,17 @@ async def get_dashboard(
 				session=session,
 			)
 		_invalidate_dashboard_cache(current_user.username)
-		return await dashboard_service._get_cached_dashboard(
+		dashboard = await dashboard_service._get_cached_dashboard(
 			session,
 			current_user,
 			force_refresh=True,
 		)
+	else:
+		dashboard = await dashboard_service._get_cached_dashboard(session, current_user)
 
-	return await dashboard_service._get_cached_dashboard(session, current_user)
+	# The dashboard payload was already validated when it was built; dump it
+	# through the cached serializer instead of having FastAPI re-walk the tree.
+	return Response(
+		content=DASHBOARD_RESPONSE_ADAPTER.dump_json(dashboard),
+		media_type="application/json",
+	)
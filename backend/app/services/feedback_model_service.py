@@ -3,10 +3,10 @@ from datetime import timedelta, timezone
 from fastapi import HTTPException, Query
 from sqlmodel import select
 from app.models import (
-	FEEDBACK_CATEGORIES,
-	FEEDBACK_PRIORITIES,
-	FEEDBACK_SOURCES,
-	FEEDBACK_STATUSES,
+	FEEDBACK_CATEGORIES_SET,
+	FEEDBACK_PRIORITIES_SET,
+	FEEDBACK_SOURCES_SET,
+	FEEDBACK_STATUSES_SET,
 	InboxMessageVisibility,
 	ReleaseNoteDelivery,
 	UserFeedback,
@@ -37,26 +37,26 @@ from app.services.service_context import SessionDependency
 
 def _normalize_feedback_choice(
 	value: str | None,
-	allowed_values: tuple[str, ...],
+	allowed_set: frozenset[str],
 	fallback: str,
 ) -> str:
 	if value is None:
 		return fallback
 
 	normalized = value.strip().upper()
-	if normalized in allowed_values:
+	if normalized in allowed_set:
 		return normalized
 	return fallback
 
 def _is_system_feedback_item(feedback: UserFeedback) -> bool:
 	category = _normalize_feedback_choice(
 		feedback.category,
-		FEEDBACK_CATEGORIES,
+		FEEDBACK_CATEGORIES_SET,
 		"USER_REQUEST",
 	)
 	source = _normalize_feedback_choice(
 		feedback.source,
-		FEEDBACK_SOURCES,
+		FEEDBACK_SOURCES_SET,
 		"USER",
 	)
 	return category.startswith("SYSTEM_") or source != "USER"
@@ -70,7 +70,7 @@ def _derive_feedback_status(feedback: UserFeedback) -> str:
 
 	status = _normalize_feedback_choice(
 		feedback.status,
-		FEEDBACK_STATUSES,
+		FEEDBACK_STATUSES_SET,
 		"OPEN",
 	)
 	if status == "RESOLVED":
@@ -101,7 +101,7 @@ def _feedback_sort_key(feedback: UserFeedback) -> tuple[int, int, float]:
 	status_value = _derive_feedback_status(feedback)
 	priority_value = _normalize_feedback_choice(
 		feedback.priority,
-		FEEDBACK_PRIORITIES,
+		FEEDBACK_PRIORITIES_SET,
 		"MEDIUM",
 	)
 	created_at = feedback.created_at
@@ -116,17 +116,17 @@ def _feedback_sort_key(feedback: UserFeedback) -> tuple[int, int, float]:
 def _to_feedback_read(feedback: UserFeedback) -> UserFeedbackRead:
 	category = _normalize_feedback_choice(
 		feedback.category,
-		FEEDBACK_CATEGORIES,
+		FEEDBACK_CATEGORIES_SET,
 		"USER_REQUEST",
 	)
 	priority = _normalize_feedback_choice(
 		feedback.priority,
-		FEEDBACK_PRIORITIES,
+		FEEDBACK_PRIORITIES_SET,
 		"MEDIUM",
 	)
 	source = _normalize_feedback_choice(
 		feedback.source,
-		FEEDBACK_SOURCES,
+		FEEDBACK_SOURCES_SET,
 		"USER",
 	)
 	status = _derive_feedback_status(feedback)
@@ -241,7 +241,7 @@ def _build_admin_feedback_list(
 		filtered_items = [
 			item
 			for item in filtered_items
-			if _normalize_feedback_choice(item.priority, FEEDBACK_PRIORITIES, "MEDIUM")
+			if _normalize_feedback_choice(item.priority, FEEDBACK_PRIORITIES_SET, "MEDIUM")
 			in priority_filter
 		]
 
@@ -1,12 +1,13 @@
 from __future__ import annotations
 from datetime import timedelta, timezone
 from fastapi import HTTPException, Query
+from sqlalchemy import update
 from sqlmodel import select
 from app.models import (
-	FEEDBACK_CATEGORIES,
-	FEEDBACK_PRIORITIES,
-	FEEDBACK_SOURCES,
-	FEEDBACK_STATUSES,
+	FEEDBACK_CATEGORIES_SET,
+	FEEDBACK_PRIORITIES_SET,
+	FEEDBACK_SOURCES_SET,
+	FEEDBACK_STATUSES_SET,
 	InboxMessageVisibility,
 	ReleaseNoteDelivery,
 	UserFeedback,
@@ -47,17 +48,17 @@ def submit_feedback(
 ) -> UserFeedbackRead:
 	requested_category = _normalize_feedback_choice(
 		payload.category,
-		FEEDBACK_CATEGORIES,
+		FEEDBACK_CATEGORIES_SET,
 		"USER_REQUEST",
 	) if payload.category is not None else None
 	requested_priority = _normalize_feedback_choice(
 		payload.priority,
-		FEEDBACK_PRIORITIES,
+		FEEDBACK_PRIORITIES_SET,
 		"MEDIUM",
 	) if payload.priority is not None else None
 	requested_source = _normalize_feedback_choice(
 		payload.source,
-		FEEDBACK_SOURCES,
+		FEEDBACK_SOURCES_SET,
 		"USER",
 	) if payload.source is not None else None
 	requested_fingerprint = (payload.fingerprint or "").strip() or None
@@ -139,9 +140,9 @@ def submit_feedback(
 				existing_feedback.closed_by = None
 				existing_feedback.status = "OPEN"
 			session.add(existing_feedback)
+			response = _to_feedback_read(existing_feedback)
 			session.commit()
-			session.refresh(existing_feedback)
-			return _to_feedback_read(existing_feedback)
+			return response
 
 	auto_resolve = (
 		category == "SYSTEM_HEARTBEAT"
@@ -163,9 +164,10 @@ def submit_feedback(
 		last_seen_at=now,
 	)
 	session.add(feedback)
+	session.flush()
+	response = _to_feedback_read(feedback)
 	session.commit()
-	session.refresh(feedback)
-	return _to_feedback_read(feedback)
+	return response
 
 def list_feedback_for_current_user(
 	current_user: CurrentUserDependency,
@@ -199,26 +201,27 @@ def mark_feedback_seen_for_current_user(
 		user_id=current_user.username,
 		message_kind="FEEDBACK",
 	)
-	feedback_items = list(
-		session.exec(
-			select(UserFeedback).where(
+	# Only the ids are needed here; skip loading the wide message/reply
+	# columns and flip the seen flag with one bulk UPDATE.
+	feedback_ids = [
+		int(feedback_id)
+		for feedback_id in session.exec(
+			select(UserFeedback.id).where(
 				UserFeedback.user_id == current_user.username,
 				UserFeedback.replied_at.is_not(None),
 				UserFeedback.reply_seen_at.is_(None),
 			),
-		),
-	)
-	feedback_items = [
-		item for item in feedback_items if (item.id or 0) not in hidden_feedback_ids
+		)
+		if int(feedback_id) not in hidden_feedback_ids
 	]
-	if not feedback_items:
+	if not feedback_ids:
 		return ActionMessageRead(message="没有新的回复。")
 
-	now = utc_now()
-	for feedback in feedback_items:
-		feedback.reply_seen_at = now
-		session.add(feedback)
-
+	session.execute(
+		update(UserFeedback)
+		.where(UserFeedback.id.in_(feedback_ids))
+		.values(reply_seen_at=utc_now()),
+	)
 	session.commit()
 	return ActionMessageRead(message="消息已标记为已读。")
 
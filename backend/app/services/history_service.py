@@ -7,6 +7,7 @@ from sqlalchemy import delete, update
 from sqlmodel import Session, select
 
 from app import runtime_state
+from app.analytics import bucket_start_utc
 from app.fixed_precision import (
 	DECIMAL_ZERO,
 	display_money,
@@ -23,7 +24,9 @@ from app.models import (
 	HoldingHistorySyncRequest,
 	LiabilityEntry,
 	OtherAsset,
+	PORTFOLIO_ROLLUP_GRANULARITIES,
 	PortfolioSnapshot,
+	PortfolioSnapshotRollup,
 	SecurityHolding,
 	SecurityHoldingTransaction,
 	UserAccount,
@@ -368,11 +371,13 @@ async def _rebuild_user_portfolio_snapshots(session: Session, user_id: str) -> N
 	)
 	if not start_candidates:
 		session.exec(delete(PortfolioSnapshot).where(PortfolioSnapshot.user_id == user_id))
+		_rebuild_portfolio_snapshot_rollups(session, user_id, [])
 		return
 
 	start_at = _date_start_utc(min(start_candidates))
 	if start_at > end_hour:
 		session.exec(delete(PortfolioSnapshot).where(PortfolioSnapshot.user_id == user_id))
+		_rebuild_portfolio_snapshot_rollups(session, user_id, [])
 		return
 
 	hours = _build_hour_buckets(start_at, end_hour)
@@ -540,12 +545,48 @@ async def _rebuild_user_portfolio_snapshots(session: Session, user_id: str) -> N
 	session.exec(delete(PortfolioSnapshot).where(PortfolioSnapshot.user_id == user_id))
 	if rows:
 		session.add_all(rows)
+	_rebuild_portfolio_snapshot_rollups(session, user_id, rows)
 
 	runtime_state.live_portfolio_states.pop(user_id, None)
 	runtime_state.live_holdings_return_states.pop(user_id, None)
 	_invalidate_dashboard_cache(user_id)
 
 
+def _rebuild_portfolio_snapshot_rollups(
+	session: Session,
+	user_id: str,
+	snapshot_rows: list[PortfolioSnapshot],
+) -> None:
+	"""Rewrite the user's rollup rows from freshly rebuilt snapshots.
+
+	The realtime sampler only maintains the current hour's buckets, so a full
+	snapshot rebuild must refresh every historical bucket too — otherwise the
+	dashboard timelines keep serving pre-rebuild totals from stale rollups.
+	"""
+	session.exec(
+		delete(PortfolioSnapshotRollup).where(PortfolioSnapshotRollup.user_id == user_id),
+	)
+	for granularity in PORTFOLIO_ROLLUP_GRANULARITIES:
+		bucket_totals: dict[datetime, Decimal] = {}
+		for snapshot in snapshot_rows:
+			# Rows arrive in ascending hour order, so the last write per
+			# bucket keeps the newest hour — the same latest-total rule the
+			# realtime sampler applies.
+			bucket = bucket_start_utc(snapshot.created_at, granularity)
+			bucket_totals[bucket] = snapshot.total_value_cny
+		session.add_all(
+			[
+				PortfolioSnapshotRollup(
+					user_id=user_id,
+					granularity=granularity,
+					bucket_start_utc=bucket,
+					total_value_cny=total_value_cny,
+				)
+				for bucket, total_value_cny in bucket_totals.items()
+			],
+		)
+
+
 def _claim_next_pending_holding_history_sync_request(
 	session: Session,
 	*,
@@ -92,13 +92,13 @@ async def list_holdings(
 	for holding in holdings:
 		valued_holding = valued_holding_map.get(holding.id or 0)
 		items.append(
-			SecurityHoldingRead(
+			SecurityHoldingRead.model_construct(
 				id=holding.id or 0,
 				symbol=holding.symbol,
 				name=holding.name,
-				quantity=holding.quantity,
+				quantity=decimal_to_float(holding.quantity),
 				fallback_currency=holding.fallback_currency,
-				cost_basis_price=holding.cost_basis_price,
+				cost_basis_price=decimal_to_float(holding.cost_basis_price),
 				market=holding.market,
 				broker=holding.broker,
 				started_on=holding.started_on,
@@ -152,10 +152,10 @@ def create_holding(
 		trigger_symbol=holding.symbol,
 	)
 	job_service.enqueue_user_portfolio_snapshot_rebuild(session, current_user.username)
+	response = _to_holding_read(holding)
 	session.commit()
-	session.refresh(holding)
 	_invalidate_dashboard_cache(current_user.username)
-	return _to_holding_read(holding)
+	return response
 
 def create_holding_legacy_endpoint(
 	_: SecurityHoldingCreate,
@@ -326,10 +326,10 @@ def update_holding(
 			trigger_symbol=holding.symbol,
 		)
 		job_service.enqueue_user_portfolio_snapshot_rebuild(session, current_user.username)
+	response = _to_holding_read(holding)
 	session.commit()
-	session.refresh(holding)
 	_invalidate_dashboard_cache(current_user.username)
-	return _to_holding_read(holding)
+	return response
 
 def delete_holding(
 	holding_id: int,
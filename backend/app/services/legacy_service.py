@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from collections import defaultdict
 
 from sqlalchemy import delete, text
 from sqlmodel import Session, select
@@ -87,15 +88,20 @@ def _migrate_legacy_holdings_to_transactions() -> None:
 		if not holdings:
 			return
 
+		# Batch-load every transaction once and group by holding key so the
+		# backfill issues a single SELECT instead of one query per holding.
+		transactions_by_key: dict[tuple[str, str, str], list[SecurityHoldingTransaction]] = defaultdict(list)
+		for transaction in session.exec(
+			select(SecurityHoldingTransaction)
+			.order_by(SecurityHoldingTransaction.user_id, SecurityHoldingTransaction.symbol, SecurityHoldingTransaction.id),
+		):
+			transactions_by_key[(transaction.user_id, transaction.symbol, transaction.market)].append(transaction)
+
 		has_changes = False
 		for holding in holdings:
-			transactions = list(
-				session.exec(
-					select(SecurityHoldingTransaction)
-					.where(SecurityHoldingTransaction.user_id == holding.user_id)
-					.where(SecurityHoldingTransaction.symbol == holding.symbol)
-					.where(SecurityHoldingTransaction.market == holding.market),
-				),
+			transactions = transactions_by_key.get(
+				(holding.user_id, holding.symbol, holding.market),
+				[],
 			)
 
 			if transactions:
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 import logging
 import re
+import sys
 
 import httpx
+import orjson
 
 from app.services.cache import TTLCache
 
@@ -15,12 +19,15 @@ INVALID_SYMBOL_MESSAGE = (
 	"HK (00700, 00700.HK, HK00700), or US (AAPL, BRK-B)."
 )
 SEARCHABLE_QUOTE_TYPES = {"EQUITY", "ETF", "MUTUALFUND", "CRYPTOCURRENCY"}
-US_EXCHANGES = {"NMS", "NGM", "NYQ", "ASE", "PCX", "BTS", "NCM", "NSQ", "OOTC", "PNK"}
-CRYPTO_EXCHANGES = {"CCC", "CCY", "CRY", "COIN"}
+US_EXCHANGES = frozenset({"NMS", "NGM", "NYQ", "ASE", "PCX", "BTS", "NCM", "NSQ", "OOTC", "PNK"})
+CN_EXCHANGES = frozenset({"SHH", "SHZ", "SHANGHAI", "SHENZHEN", "SHA", "SHE"})
+CRYPTO_EXCHANGES = frozenset({"CCC", "CCY", "CRY", "COIN"})
 EASTMONEY_SEARCH_TOKEN = "D43BF722C8E33BDC906FB84D85E326E8"
 BITGET_EXCHANGE = "BITGET"
 BITGET_SOURCE_LABEL = "Bitget"
-BITGET_STABLE_QUOTES = {"USDT", "USDC"}
+BITGET_STABLE_QUOTES = frozenset({"USDT", "USDC"})
+# Constant-folded once: the preferred quote currency never changes at runtime.
+BITGET_DEFAULT_QUOTE = "USDT" if "USDT" in BITGET_STABLE_QUOTES else sorted(BITGET_STABLE_QUOTES)[0]
 logger = logging.getLogger(__name__)
 
 
@@ -49,6 +56,7 @@ def _describe_http_error(exc: httpx.HTTPError) -> str:
 	return exc.__class__.__name__
 
 
+@lru_cache(maxsize=64)
 def build_fx_symbol(from_currency: str, to_currency: str) -> str:
 	"""Translate a currency pair into a Yahoo Finance symbol."""
 	return f"{from_currency.upper()}{to_currency.upper()}=X"
@@ -56,49 +64,91 @@ def build_fx_symbol(from_currency: str, to_currency: str) -> str:
 
 def _normalize_hk_code(raw_code: str) -> str:
 	"""Normalize HK numeric codes to a canonical 4+ digit form without extra leading zeroes."""
+	if raw_code.isascii():
+		return (raw_code.lstrip("0") or "0").zfill(4)
+	# Non-ASCII decimal digits are accepted upstream; int() re-renders them
+	# into the ASCII form Yahoo expects.
 	return str(int(raw_code)).zfill(4)
 
 
-def normalize_symbol(symbol: str) -> str:
-	"""Normalize common CN/HK/US ticker formats into Yahoo-compatible symbols."""
-	candidate = symbol.strip().upper()
-	if not candidate:
-		raise ValueError("Symbol cannot be empty.")
+# Compiled once at import: normalize_symbol runs for every quote lookup. The
+# FX, CN/HK, and crypto shapes are handled with plain string checks; only the
+# open-ended US ticker shape still needs a pattern.
+_US_SYMBOL_PATTERN = re.compile(r"[A-Z][A-Z0-9]*(?:[.-][A-Z0-9]+)?")
+
 
-	if re.fullmatch(r"^[A-Z]{6}=X$", candidate):
+def _canonical_symbol_candidate(symbol: str) -> str:
+	"""Strip and upper-case, skipping the .upper() allocation when already canonical."""
+	candidate = symbol.strip()
+	if candidate.isascii() and (candidate.isupper() or candidate.isdecimal()):
 		return candidate
+	return candidate.upper()
 
-	if match := re.fullmatch(r"^(SH|SZ)(\d{6})$", candidate):
-		suffix = "SS" if match.group(1) == "SH" else "SZ"
-		return f"{match.group(2)}.{suffix}"
 
-	if match := re.fullmatch(r"^HK(\d{1,5})$", candidate):
-		return f"{_normalize_hk_code(match.group(1))}.HK"
+def normalize_symbol(symbol: str) -> str:
+	"""Normalize common CN/HK/US ticker formats into Yahoo-compatible symbols."""
+	candidate = _canonical_symbol_candidate(symbol)
+	if not candidate:
+		raise ValueError("Symbol cannot be empty.")
 
-	if re.fullmatch(r"^\d{6}\.(SS|SZ)$", candidate):
+	return _normalize_symbol_cached(candidate)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_symbol_cached(candidate: str) -> str:
+	"""Run the pattern dispatch for an already stripped/uppercased candidate.
+
+	The symbol universe a deployment sees is small and repeats on every quote
+	lookup, so cache hits skip the dispatch entirely. Invalid candidates
+	raise and are deliberately not cached.
+	"""
+	if candidate[0].isdecimal():
+		code, separator, suffix = candidate.partition(".")
+		if code.isdecimal():
+			if not separator:
+				if len(code) == 6:
+					market_suffix = "SS" if code[0] in {"5", "6", "9"} else "SZ"
+					return f"{code}.{market_suffix}"
+				if len(code) <= 5:
+					return f"{_normalize_hk_code(code)}.HK"
+			elif suffix in ("SS", "SZ"):
+				if len(code) == 6:
+					return candidate
+			elif suffix == "HK" and len(code) <= 5:
+				return f"{_normalize_hk_code(code)}.HK"
+
+		raise ValueError(INVALID_SYMBOL_MESSAGE)
+
+	if (
+		len(candidate) == 8
+		and candidate.endswith("=X")
+		and candidate.isascii()
+		and candidate[:6].isalpha()
+	):
 		return candidate
 
-	if re.fullmatch(r"^\d{1,5}\.HK$", candidate):
-		code, _, _ = candidate.partition(".")
-		return f"{_normalize_hk_code(code)}.HK"
+	if len(candidate) == 8 and candidate[2:].isdecimal():
+		if candidate.startswith("SH"):
+			return f"{candidate[2:]}.SS"
+		if candidate.startswith("SZ"):
+			return f"{candidate[2:]}.SZ"
 
-	if re.fullmatch(r"^\d{6}$", candidate):
-		suffix = "SS" if candidate[0] in {"5", "6", "9"} else "SZ"
-		return f"{candidate}.{suffix}"
+	if candidate.startswith("HK") and len(candidate) <= 7 and candidate[2:].isdecimal():
+		return f"{_normalize_hk_code(candidate[2:])}.HK"
 
-	if re.fullmatch(r"^\d{1,5}$", candidate):
-		return f"{_normalize_hk_code(candidate)}.HK"
-
-	if re.fullmatch(r"^[A-Z][A-Z0-9]*(?:[.-][A-Z0-9]+)?$", candidate):
+	if _US_SYMBOL_PATTERN.fullmatch(candidate):
 		return candidate
 
 	raise ValueError(INVALID_SYMBOL_MESSAGE)
 
 
+@lru_cache(maxsize=1024)
 def build_eastmoney_secid(symbol: str) -> str:
 	"""Map normalized CN/HK symbols into Eastmoney's secid format."""
-	normalized_symbol = normalize_symbol(symbol)
+	return _eastmoney_secid_from_normalized(normalize_symbol(symbol))
+
 
+def _eastmoney_secid_from_normalized(normalized_symbol: str) -> str:
 	if normalized_symbol.endswith(".SS"):
 		return f"1.{normalized_symbol.removesuffix('.SS')}"
 	if normalized_symbol.endswith(".SZ"):
@@ -114,8 +164,7 @@ def build_bitget_symbol(symbol: str) -> str:
 	"""Map app-level crypto symbols into Bitget's spot symbol format."""
 	normalized_symbol = normalize_symbol_for_market(symbol, "CRYPTO")
 	base, _, _quote = normalized_symbol.partition("-")
-	quote_currency = "USDT" if "USDT" in BITGET_STABLE_QUOTES else sorted(BITGET_STABLE_QUOTES)[0]
-	return f"{base}{quote_currency}"
+	return f"{base}{BITGET_DEFAULT_QUOTE}"
 
 
 def _parse_epoch_millis(value: str | int | float | None) -> datetime | None:
@@ -317,63 +366,76 @@ LOCAL_SEARCH_CATALOG = (
 )
 
 
+_CURRENCY_BY_MARKET = {"CRYPTO": "USD", "HK": "HKD", "US": "USD"}
+
+
 def _default_currency_for_market(market: str) -> str:
-	if market == "CRYPTO":
-		return "USD"
-	if market == "HK":
-		return "HKD"
-	if market == "US":
-		return "USD"
-	return "CNY"
+	return _CURRENCY_BY_MARKET.get(market, "CNY")
 
 
 def normalize_symbol_for_market(symbol: str, market: str | None = None) -> str:
 	"""Normalize symbols with market-specific handling for crypto pairs."""
 	normalized_market = (market or "").strip().upper()
-	candidate = symbol.strip().upper()
+	candidate = _canonical_symbol_candidate(symbol)
+	if not candidate:
+		raise ValueError("Symbol cannot be empty.")
 
 	if normalized_market == "CRYPTO":
-		if re.fullmatch(r"^[A-Z0-9]{2,15}$", candidate):
+		base, separator, quote_currency = candidate.partition("-")
+		if not separator:
+			base, separator, quote_currency = candidate.partition("/")
+		if separator:
+			if (
+				quote_currency in ("USD", "USDT", "USDC")
+				and 2 <= len(base) <= 15
+				and base.isascii()
+				and base.isalnum()
+			):
+				return f"{base}-USD"
+		elif 2 <= len(candidate) <= 15 and candidate.isascii() and candidate.isalnum():
 			return f"{candidate}-USD"
 
-		if re.fullmatch(r"^[A-Z0-9]{2,15}[-/](USD|USDT|USDC)$", candidate):
-			base = re.split(r"[-/]", candidate, maxsplit=1)[0]
-			return f"{base}-USD"
-
-	return normalize_symbol(candidate)
+	# candidate is already stripped and upper-cased; go straight to the cached
+	# pattern dispatch instead of re-normalizing through normalize_symbol.
+	return _normalize_symbol_cached(candidate)
 
 
+@lru_cache(maxsize=2048)
 def infer_security_market(
 	symbol: str,
 	exchange: str | None = None,
 	quote_type: str | None = None,
 ) -> str:
-	"""Infer a frontend-friendly market code from quote metadata."""
+	"""Infer a frontend-friendly market code from quote metadata.
+
+	Pure on its arguments and called for every parsed search result, so the
+	classification is memoized per (symbol, exchange, quote_type) triple.
+	"""
 	normalized_symbol = symbol.strip().upper()
 	normalized_exchange = (exchange or "").strip().upper()
 	normalized_quote_type = (quote_type or "").strip().upper()
 
 	if normalized_quote_type == "CRYPTOCURRENCY" or normalized_exchange in CRYPTO_EXCHANGES:
 		return "CRYPTO"
-	if re.fullmatch(r"^[A-Z0-9]{2,15}-(USD|USDT|USDC)$", normalized_symbol):
+	base, separator, quote_currency = normalized_symbol.partition("-")
+	if (
+		separator
+		and quote_currency in ("USD", "USDT", "USDC")
+		and 2 <= len(base) <= 15
+		and base.isascii()
+		and base.isalnum()
+	):
 		return "CRYPTO"
 
 	if normalized_symbol.endswith(".HK") or normalized_exchange.startswith("HKG"):
 		return "HK"
 	if normalized_symbol.endswith(".SS") or normalized_symbol.endswith(".SZ"):
 		return "CN"
-	if normalized_exchange in {
-		"SHH",
-		"SHZ",
-		"SHANGHAI",
-		"SHENZHEN",
-		"SHA",
-		"SHE",
-	}:
+	if normalized_exchange in CN_EXCHANGES:
 		return "CN"
 	if normalized_exchange in US_EXCHANGES:
 		return "US"
-	if not normalized_exchange and re.fullmatch(r"^[A-Z][A-Z0-9]*(?:[.-][A-Z0-9]+)?$", normalized_symbol):
+	if not normalized_exchange and _US_SYMBOL_PATTERN.fullmatch(normalized_symbol):
 		return "US"
 	return "OTHER"
 
@@ -388,7 +450,7 @@ def parse_eastmoney_search_item(item: dict[str, str]) -> SecuritySearchResult |
 	quote_id = str(item.get("QuoteID") or "").strip()
 	classify = str(item.get("Classify") or "").strip().upper()
 	jys = str(item.get("JYS") or "").strip().upper()
-	exchange_name = jys or None
+	exchange_name = sys.intern(jys) if jys else None
 
 	if classify == "NEEQ":
 		return None
@@ -437,28 +499,32 @@ def parse_eastmoney_search_item(item: dict[str, str]) -> SecuritySearchResult |
 
 
 def _merge_search_results(
-	primary_results: list[SecuritySearchResult],
-	secondary_results: list[SecuritySearchResult],
+	*result_lists: list[SecuritySearchResult],
 ) -> list[SecuritySearchResult]:
+	"""Concatenate result lists in priority order, deduping in one pass."""
 	merged_results: list[SecuritySearchResult] = []
 	seen_symbols: set[str] = set()
 
-	for result in [*primary_results, *secondary_results]:
-		dedupe_key = (
-			f"{result.symbol}::{result.source or ''}"
-			if result.market == "CRYPTO"
-			else result.symbol
-		)
-		if dedupe_key in seen_symbols:
-			continue
-		merged_results.append(result)
-		seen_symbols.add(dedupe_key)
+	for results in result_lists:
+		for result in results:
+			dedupe_key = (
+				f"{result.symbol}::{result.source or ''}"
+				if result.market == "CRYPTO"
+				else result.symbol
+			)
+			if dedupe_key in seen_symbols:
+				continue
+			merged_results.append(result)
+			seen_symbols.add(dedupe_key)
 
 	return merged_results
 
 
+_CJK_PATTERN = re.compile(r"[\u4e00-\u9fff]")
+
+
 def _contains_cjk_characters(value: str) -> bool:
-	return any("\u4e00" <= character <= "\u9fff" for character in value)
+	return _CJK_PATTERN.search(value) is not None
 
 
 def build_local_search_results(query: str) -> list[SecuritySearchResult]:
@@ -491,15 +557,42 @@ def build_local_search_results(query: str) -> list[SecuritySearchResult]:
 					),
 				)
 
-	return _merge_search_results(results, [])
+	return _merge_search_results(results)
 
 
-class YahooQuoteProvider:
-	YAHOO_QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
-	YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart"
+class _HttpProviderBase:
+	"""Base for providers that reuse one long-lived HTTP client.
+
+	Creating an ``httpx.AsyncClient`` per request forced a fresh DNS lookup,
+	TCP connect, and TLS handshake for every quote. The shared client keeps
+	connections alive across calls; it is created lazily so it binds to the
+	running event loop.
+	"""
 
 	def __init__(self, timeout: float = 10.0) -> None:
 		self.timeout = timeout
+		self._client: httpx.AsyncClient | None = None
+
+	def _client_kwargs(self) -> dict[str, object]:
+		return {
+			"timeout": self.timeout,
+			"limits": httpx.Limits(max_keepalive_connections=32, max_connections=64),
+		}
+
+	def _get_client(self) -> httpx.AsyncClient:
+		if self._client is None:
+			self._client = httpx.AsyncClient(**self._client_kwargs())
+		return self._client
+
+	async def aclose(self) -> None:
+		"""Close the shared client; safe to call when no request was ever made."""
+		if self._client is not None and not self._client.is_closed:
+			await self._client.aclose()
+
+
+class YahooQuoteProvider(_HttpProviderBase):
+	YAHOO_QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+	YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart"
 
 	async def _request_json(
 		self,
@@ -510,14 +603,13 @@ class YahooQuoteProvider:
 		source_label: str,
 	) -> dict[str, object]:
 		try:
-			async with httpx.AsyncClient(timeout=self.timeout) as client:
-				response = await client.get(
-					url,
-					params=params,
-					headers={"User-Agent": "Mozilla/5.0"},
-				)
-				response.raise_for_status()
-				payload = response.json()
+			response = await self._get_client().get(
+				url,
+				params=params,
+				headers={"User-Agent": "Mozilla/5.0"},
+			)
+			response.raise_for_status()
+			payload = orjson.loads(response.content)
 		except httpx.HTTPError as exc:
 			error_details = _describe_http_error(exc)
 			raise QuoteLookupError(
@@ -534,12 +626,7 @@ class YahooQuoteProvider:
 		return payload
 
 	@staticmethod
-	def _parse_quote_payload(symbol: str, payload: dict[str, object]) -> Quote:
-		results = payload.get("quoteResponse", {}).get("result", [])
-		if not results:
-			raise QuoteLookupError(f"No quote data returned for {symbol}.")
-
-		result = results[0]
+	def _parse_quote_result(symbol: str, result: dict[str, object]) -> Quote:
 		price = result.get("regularMarketPrice")
 		currency = result.get("currency") or result.get("financialCurrency")
 		if price in (None, 0) or not currency:
@@ -556,6 +643,14 @@ class YahooQuoteProvider:
 			market_time=market_time,
 		)
 
+	@staticmethod
+	def _parse_quote_payload(symbol: str, payload: dict[str, object]) -> Quote:
+		results = payload.get("quoteResponse", {}).get("result", [])
+		if not results:
+			raise QuoteLookupError(f"No quote data returned for {symbol}.")
+
+		return YahooQuoteProvider._parse_quote_result(symbol, results[0])
+
 	@staticmethod
 	def _parse_chart_payload(symbol: str, payload: dict[str, object]) -> Quote:
 		result_list = payload.get("chart", {}).get("result") or []
@@ -622,34 +717,63 @@ class YahooQuoteProvider:
 				raise
 			raise QuoteLookupError(f"{quote_error}; {exc}") from exc
 
+	async def fetch_quotes(self, symbols: list[str]) -> dict[str, Quote]:
+		"""Fetch several quotes with one request to the multi-symbol endpoint.
+
+		Symbols missing or incomplete in the response are simply omitted so the
+		caller can retry them through the single-symbol path with its chart
+		fallback.
+		"""
+		if not symbols:
+			return {}
+
+		joined_symbols = ",".join(symbols)
+		payload = await self._request_json(
+			self.YAHOO_QUOTE_URL,
+			symbol=joined_symbols,
+			params={"symbols": joined_symbols},
+			source_label="Yahoo quote",
+		)
+		quotes: dict[str, Quote] = {}
+		for result in payload.get("quoteResponse", {}).get("result", []) or []:
+			result_symbol = str(result.get("symbol") or "").strip().upper()
+			if not result_symbol:
+				continue
+			try:
+				quotes[result_symbol] = self._parse_quote_result(result_symbol, result)
+			except QuoteLookupError:
+				continue
+
+		return quotes
 
-class EastMoneyQuoteProvider:
+
+class EastMoneyQuoteProvider(_HttpProviderBase):
 	EASTMONEY_QUOTE_URL = "https://push2.eastmoney.com/api/qt/stock/get"
 
-	def __init__(self, timeout: float = 10.0) -> None:
-		self.timeout = timeout
+	def _client_kwargs(self) -> dict[str, object]:
+		kwargs = super()._client_kwargs()
+		kwargs["follow_redirects"] = True
+		return kwargs
 
 	async def fetch_quote(self, symbol: str) -> Quote:
 		"""Fetch CN/HK quotes from Eastmoney when the primary source is unavailable."""
 		try:
-			secid = build_eastmoney_secid(symbol)
+			normalized_symbol = normalize_symbol(symbol)
+			secid = _eastmoney_secid_from_normalized(normalized_symbol)
 		except ValueError as exc:
 			raise QuoteLookupError(str(exc)) from exc
 
-		normalized_symbol = normalize_symbol(symbol)
-
 		try:
-			async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
-				response = await client.get(
-					self.EASTMONEY_QUOTE_URL,
-					params={"secid": secid, "fields": "f43,f57,f58"},
-					headers={
-						"User-Agent": "Mozilla/5.0",
-						"Referer": "https://quote.eastmoney.com/",
-					},
-				)
-				response.raise_for_status()
-				payload = response.json()
+			response = await self._get_client().get(
+				self.EASTMONEY_QUOTE_URL,
+				params={"secid": secid, "fields": "f43,f57,f58"},
+				headers={
+					"User-Agent": "Mozilla/5.0",
+					"Referer": "https://quote.eastmoney.com/",
+				},
+			)
+			response.raise_for_status()
+			payload = orjson.loads(response.content)
 		except httpx.HTTPError as exc:
 			error_details = _describe_http_error(exc)
 			raise QuoteLookupError(
@@ -676,12 +800,9 @@ class EastMoneyQuoteProvider:
 		)
 
 
-class TencentQuoteProvider:
+class TencentQuoteProvider(_HttpProviderBase):
 	TENCENT_QUOTE_URL = "https://qt.gtimg.cn/q="
 
-	def __init__(self, timeout: float = 10.0) -> None:
-		self.timeout = timeout
-
 	@staticmethod
 	def _build_tencent_symbol(symbol: str) -> tuple[str, str]:
 		normalized_symbol = normalize_symbol(symbol)
@@ -704,14 +825,13 @@ class TencentQuoteProvider:
 		tencent_symbol, currency = self._build_tencent_symbol(normalized_symbol)
 
 		try:
-			async with httpx.AsyncClient(timeout=self.timeout) as client:
-				response = await client.get(
-					f"{self.TENCENT_QUOTE_URL}{tencent_symbol}",
-					headers={"User-Agent": "Mozilla/5.0"},
-				)
-				response.raise_for_status()
-				# The endpoint defaults to GBK and includes non-ASCII market names.
-				payload_text = response.content.decode("gbk", errors="ignore")
+			response = await self._get_client().get(
+				f"{self.TENCENT_QUOTE_URL}{tencent_symbol}",
+				headers={"User-Agent": "Mozilla/5.0"},
+			)
+			response.raise_for_status()
+			# The endpoint defaults to GBK and includes non-ASCII market names.
+			payload_text = response.content.decode("gbk", errors="ignore")
 		except httpx.HTTPError as exc:
 			error_details = _describe_http_error(exc)
 			raise QuoteLookupError(
@@ -749,12 +869,9 @@ class TencentQuoteProvider:
 		)
 
 
-class BitgetQuoteProvider:
+class BitgetQuoteProvider(_HttpProviderBase):
 	BITGET_TICKER_URL = "https://api.bitget.com/api/v2/spot/market/tickers"
 
-	def __init__(self, timeout: float = 10.0) -> None:
-		self.timeout = timeout
-
 	async def fetch_quote(self, symbol: str) -> Quote:
 		"""Fetch spot crypto quotes from Bitget's public market endpoint."""
 		normalized_symbol = normalize_symbol_for_market(symbol, "CRYPTO")
@@ -771,14 +888,13 @@ class BitgetQuoteProvider:
 		bitget_symbol = build_bitget_symbol(normalized_symbol)
 
 		try:
-			async with httpx.AsyncClient(timeout=self.timeout) as client:
-				response = await client.get(
-					self.BITGET_TICKER_URL,
-					params={"symbol": bitget_symbol},
-					headers={"User-Agent": "Mozilla/5.0"},
-				)
-				response.raise_for_status()
-				payload = response.json()
+			response = await self._get_client().get(
+				self.BITGET_TICKER_URL,
+				params={"symbol": bitget_symbol},
+				headers={"User-Agent": "Mozilla/5.0"},
+			)
+			response.raise_for_status()
+			payload = orjson.loads(response.content)
 		except httpx.HTTPError as exc:
 			raise QuoteLookupError(f"Bitget quote request failed for {normalized_symbol}.") from exc
 
@@ -814,31 +930,27 @@ class BitgetQuoteProvider:
 		)
 
 
-class YahooSecuritySearchProvider:
+class YahooSecuritySearchProvider(_HttpProviderBase):
 	YAHOO_SEARCH_URL = "https://query1.finance.yahoo.com/v1/finance/search"
 
-	def __init__(self, timeout: float = 10.0) -> None:
-		self.timeout = timeout
-
 	async def search(self, query: str) -> list[SecuritySearchResult]:
 		"""Search Yahoo's public security lookup feed."""
 		if not query.strip():
 			return []
 
 		try:
-			async with httpx.AsyncClient(timeout=self.timeout) as client:
-				response = await client.get(
-					self.YAHOO_SEARCH_URL,
-					params={
-						"q": query,
-						"quotesCount": 8,
-						"newsCount": 0,
-						"enableFuzzyQuery": False,
-					},
-					headers={"User-Agent": "Mozilla/5.0"},
-				)
-				response.raise_for_status()
-				payload = response.json()
+			response = await self._get_client().get(
+				self.YAHOO_SEARCH_URL,
+				params={
+					"q": query,
+					"quotesCount": 8,
+					"newsCount": 0,
+					"enableFuzzyQuery": False,
+				},
+				headers={"User-Agent": "Mozilla/5.0"},
+			)
+			response.raise_for_status()
+			payload = orjson.loads(response.content)
 		except httpx.HTTPError as exc:
 			raise QuoteLookupError(f"Security search request failed for {query}.") from exc
 		except ValueError as exc:
@@ -867,13 +979,16 @@ class YahooSecuritySearchProvider:
 				continue
 
 			name = str(item.get("shortname") or item.get("longname") or symbol).strip()
-			exchange = str(item.get("exchange") or "").strip() or None
+			# Exchange and currency codes come from a tiny vocabulary that
+			# repeats across every payload item; intern them so the result
+			# objects share singletons (same as _normalize_currency elsewhere).
+			exchange_code = str(item.get("exchange") or "").strip()
+			exchange = sys.intern(exchange_code) if exchange_code else None
 			market = infer_security_market(symbol, exchange, quote_type)
 			if market == "OTHER":
 				continue
-			currency = str(item.get("currency") or "").strip().upper() or _default_currency_for_market(
-				market,
-			)
+			currency_code = str(item.get("currency") or "").strip().upper()
+			currency = sys.intern(currency_code) if currency_code else _default_currency_for_market(market)
 			results.append(
 				SecuritySearchResult(
 					symbol=symbol,
@@ -889,34 +1004,30 @@ class YahooSecuritySearchProvider:
 		return results
 
 
-class EastMoneySecuritySearchProvider:
+class EastMoneySecuritySearchProvider(_HttpProviderBase):
 	EASTMONEY_SEARCH_URL = "https://searchapi.eastmoney.com/api/suggest/get"
 
-	def __init__(self, timeout: float = 10.0) -> None:
-		self.timeout = timeout
-
 	async def search(self, query: str) -> list[SecuritySearchResult]:
 		"""Search A-share/HK/US symbols via Eastmoney's public suggestion endpoint."""
 		if not query.strip():
 			return []
 
 		try:
-			async with httpx.AsyncClient(timeout=self.timeout) as client:
-				response = await client.get(
-					self.EASTMONEY_SEARCH_URL,
-					params={
-						"input": query,
-						"type": "14",
-						"count": "10",
-						"token": EASTMONEY_SEARCH_TOKEN,
-					},
-					headers={
-						"User-Agent": "Mozilla/5.0",
-						"Referer": "https://quote.eastmoney.com/",
-					},
-				)
-				response.raise_for_status()
-				payload = response.json()
+			response = await self._get_client().get(
+				self.EASTMONEY_SEARCH_URL,
+				params={
+					"input": query,
+					"type": "14",
+					"count": "10",
+					"token": EASTMONEY_SEARCH_TOKEN,
+				},
+				headers={
+					"User-Agent": "Mozilla/5.0",
+					"Referer": "https://quote.eastmoney.com/",
+				},
+			)
+			response.raise_for_status()
+			payload = orjson.loads(response.content)
 		except httpx.HTTPError as exc:
 			raise QuoteLookupError(f"Eastmoney search request failed for {query}.") from exc
 		except ValueError as exc:
@@ -941,22 +1052,18 @@ class EastMoneySecuritySearchProvider:
 		return results
 
 
-class FrankfurterRateProvider:
+class FrankfurterRateProvider(_HttpProviderBase):
 	FRANKFURTER_URL = "https://api.frankfurter.dev/v1/latest"
 
-	def __init__(self, timeout: float = 10.0) -> None:
-		self.timeout = timeout
-
 	async def fetch_rate(self, from_currency: str, to_currency: str) -> float:
 		"""Fetch a conversion rate using Frankfurter's ECB-backed feed."""
 		try:
-			async with httpx.AsyncClient(timeout=self.timeout) as client:
-				response = await client.get(
-					self.FRANKFURTER_URL,
-					params={"base": from_currency, "symbols": to_currency},
-				)
-				response.raise_for_status()
-				payload = response.json()
+			response = await self._get_client().get(
+				self.FRANKFURTER_URL,
+				params={"base": from_currency, "symbols": to_currency},
+			)
+			response.raise_for_status()
+			payload = orjson.loads(response.content)
 		except httpx.HTTPError as exc:
 			raise QuoteLookupError(
 				f"FX provider request failed for {from_currency}/{to_currency}.",
@@ -969,19 +1076,15 @@ class FrankfurterRateProvider:
 		return float(rate)
 
 
-class OpenExchangeRateProvider:
+class OpenExchangeRateProvider(_HttpProviderBase):
 	OPEN_EXCHANGE_RATE_URL = "https://open.er-api.com/v6/latest"
 
-	def __init__(self, timeout: float = 10.0) -> None:
-		self.timeout = timeout
-
 	async def fetch_rate(self, from_currency: str, to_currency: str) -> float:
 		"""Fetch a conversion rate from Open ExchangeRate-API as a fallback source."""
 		try:
-			async with httpx.AsyncClient(timeout=self.timeout) as client:
-				response = await client.get(f"{self.OPEN_EXCHANGE_RATE_URL}/{from_currency}")
-				response.raise_for_status()
-				payload = response.json()
+			response = await self._get_client().get(f"{self.OPEN_EXCHANGE_RATE_URL}/{from_currency}")
+			response.raise_for_status()
+			payload = orjson.loads(response.content)
 		except httpx.HTTPError as exc:
 			raise QuoteLookupError(
 				f"FX provider request failed for {from_currency}/{to_currency}.",
@@ -1032,6 +1135,9 @@ class MarketDataClient:
 		self.fx_ttl_seconds = fx_ttl_seconds
 		self._quote_refresh_tasks: dict[str, asyncio.Task[None]] = {}
 		self._fx_refresh_tasks: dict[str, asyncio.Task[None]] = {}
+		self._quote_inflight: dict[str, asyncio.Future[Quote]] = {}
+		self._fx_inflight: dict[str, asyncio.Future[float]] = {}
+		self._search_inflight: dict[str, asyncio.Future[list[SecuritySearchResult]]] = {}
 
 	async def _fetch_quote_with_retry(
 		self,
@@ -1076,6 +1182,20 @@ class MarketDataClient:
 			f"FX provider request failed for {from_currency}/{to_currency}.",
 		)
 
+	async def aclose(self) -> None:
+		"""Close the providers' shared HTTP clients on application shutdown."""
+		for provider in (
+			self.quote_provider,
+			self.fallback_quote_provider,
+			self.backup_quote_provider,
+			self.crypto_quote_provider,
+			self.china_search_provider,
+			self.search_provider,
+			self.fx_provider,
+			self.fallback_fx_provider,
+		):
+			await provider.aclose()
+
 	def clear_runtime_caches(self, *, clear_search: bool = False) -> None:
 		"""Expire runtime caches so refreshes refetch while stale values remain available."""
 		self.quote_cache.expire_all()
@@ -1124,12 +1244,36 @@ class MarketDataClient:
 			error_message = f"Quote provider request failed for {normalized_symbol}."
 		raise QuoteLookupError(error_message)
 
+	async def _fetch_quote_single_flight(
+		self,
+		normalized_symbol: str,
+		resolved_market: str | None,
+	) -> Quote:
+		"""Coalesce concurrent cache misses for one symbol into a single provider call."""
+		inflight_quote = self._quote_inflight.get(normalized_symbol)
+		if inflight_quote is not None:
+			return await asyncio.shield(inflight_quote)
+
+		inflight_future: asyncio.Future[Quote] = asyncio.get_running_loop().create_future()
+		self._quote_inflight[normalized_symbol] = inflight_future
+		try:
+			quote = await self._fetch_quote_from_providers(normalized_symbol, resolved_market)
+		except BaseException as exc:
+			inflight_future.set_exception(exc)
+			inflight_future.exception()
+			raise
+		else:
+			inflight_future.set_result(quote)
+			return quote
+		finally:
+			self._quote_inflight.pop(normalized_symbol, None)
+
 	async def _refresh_quote_cache(
 		self,
 		normalized_symbol: str,
 		resolved_market: str | None,
 	) -> None:
-		quote = await self._fetch_quote_from_providers(normalized_symbol, resolved_market)
+		quote = await self._fetch_quote_single_flight(normalized_symbol, resolved_market)
 		self.quote_cache.set(normalized_symbol, quote, ttl_seconds=self.quote_ttl_seconds)
 
 	def _ensure_quote_refresh(
@@ -1187,13 +1331,38 @@ class MarketDataClient:
 			error_message = f"FX provider request failed for {from_code}/{to_code}."
 		raise QuoteLookupError(error_message)
 
+	async def _fetch_fx_rate_single_flight(
+		self,
+		from_code: str,
+		to_code: str,
+	) -> float:
+		"""Coalesce concurrent cache misses for one currency pair into a single provider call."""
+		cache_key = f"{from_code}:{to_code}"
+		inflight_rate = self._fx_inflight.get(cache_key)
+		if inflight_rate is not None:
+			return await asyncio.shield(inflight_rate)
+
+		inflight_future: asyncio.Future[float] = asyncio.get_running_loop().create_future()
+		self._fx_inflight[cache_key] = inflight_future
+		try:
+			rate = await self._fetch_fx_rate_from_providers(from_code, to_code)
+		except BaseException as exc:
+			inflight_future.set_exception(exc)
+			inflight_future.exception()
+			raise
+		else:
+			inflight_future.set_result(rate)
+			return rate
+		finally:
+			self._fx_inflight.pop(cache_key, None)
+
 	async def _refresh_fx_cache(
 		self,
 		from_code: str,
 		to_code: str,
 	) -> None:
 		cache_key = f"{from_code}:{to_code}"
-		rate = await self._fetch_fx_rate_from_providers(from_code, to_code)
+		rate = await self._fetch_fx_rate_single_flight(from_code, to_code)
 		self.fx_cache.set(cache_key, rate, ttl_seconds=self.fx_ttl_seconds)
 
 	def _ensure_fx_refresh(
@@ -1249,7 +1418,7 @@ class MarketDataClient:
 			raise QuoteLookupError(f"{normalized_symbol} quote cache is still warming.")
 
 		try:
-			quote = await self._fetch_quote_from_providers(normalized_symbol, resolved_market)
+			quote = await self._fetch_quote_single_flight(normalized_symbol, resolved_market)
 		except QuoteLookupError as exc:
 			error_message = str(exc)
 			stale_quote = self.quote_cache.get_stale(normalized_symbol)
@@ -1262,6 +1431,84 @@ class MarketDataClient:
 		self.quote_cache.set(normalized_symbol, quote, ttl_seconds=self.quote_ttl_seconds)
 		return quote, []
 
+	async def fetch_quotes(
+		self,
+		symbol_market_pairs: Iterable[tuple[str, str | None]],
+		*,
+		concurrency: int | None = None,
+	) -> tuple[dict[tuple[str, str | None], Quote], list[str]]:
+		"""Fetch many quotes at once, batching Yahoo-served symbols into one request.
+
+		Yahoo's quote endpoint accepts a comma-separated symbol list, so all
+		uncached symbols whose provider chain starts at Yahoo share a single
+		round-trip. CN/HK/crypto symbols keep their per-symbol provider chains,
+		fetched concurrently. Returns quotes keyed by the input pairs plus
+		warnings for the pairs that failed, which are omitted from the result.
+		"""
+		quotes: dict[tuple[str, str | None], Quote] = {}
+		warnings: list[str] = []
+		batched_pairs: dict[str, list[tuple[str, str | None]]] = {}
+		single_pairs: list[tuple[str, str | None]] = []
+
+		for pair in dict.fromkeys(symbol_market_pairs):
+			symbol, market = pair
+			normalized_market = (market or "").strip().upper() or None
+			try:
+				normalized_symbol = normalize_symbol_for_market(symbol, normalized_market)
+			except ValueError as exc:
+				warnings.append(str(exc))
+				continue
+			cached_quote = self.quote_cache.get(normalized_symbol)
+			if cached_quote is not None:
+				quotes[pair] = cached_quote
+				continue
+			resolved_market = normalized_market or infer_security_market(normalized_symbol)
+			if resolved_market in {"HK", "CN", "CRYPTO"}:
+				single_pairs.append(pair)
+			else:
+				batched_pairs.setdefault(normalized_symbol, []).append(pair)
+
+		if batched_pairs:
+			try:
+				batch_quotes = await self.quote_provider.fetch_quotes(sorted(batched_pairs))
+			except QuoteLookupError:
+				batch_quotes = {}
+			for normalized_symbol, pairs in batched_pairs.items():
+				quote = batch_quotes.get(normalized_symbol)
+				if quote is None:
+					# Retry through the single-symbol path so the chart
+					# fallback and stale-cache handling still apply.
+					single_pairs.extend(pairs)
+					continue
+				self.quote_cache.set(normalized_symbol, quote, ttl_seconds=self.quote_ttl_seconds)
+				for pair in pairs:
+					quotes[pair] = quote
+
+		semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+
+		async def fetch_single(
+			pair: tuple[str, str | None],
+		) -> tuple[tuple[str, str | None], Quote | None, list[str]]:
+			symbol, market = pair
+			try:
+				if semaphore is None:
+					quote, quote_warnings = await self.fetch_quote(symbol, market)
+				else:
+					async with semaphore:
+						quote, quote_warnings = await self.fetch_quote(symbol, market)
+			except QuoteLookupError as exc:
+				return pair, None, [str(exc)]
+			return pair, quote, quote_warnings
+
+		for pair, quote, pair_warnings in await asyncio.gather(
+			*(fetch_single(pair) for pair in single_pairs),
+		):
+			warnings.extend(pair_warnings)
+			if quote is not None:
+				quotes[pair] = quote
+
+		return quotes, warnings
+
 	async def fetch_fx_rate(
 		self,
 		from_currency: str,
@@ -1289,7 +1536,7 @@ class MarketDataClient:
 			raise QuoteLookupError(f"{from_code}/{to_code} FX cache is still warming.")
 
 		try:
-			rate = await self._fetch_fx_rate_from_providers(from_code, to_code)
+			rate = await self._fetch_fx_rate_single_flight(from_code, to_code)
 		except QuoteLookupError as exc:
 			error_message = str(exc)
 			stale_rate = self.fx_cache.get_stale(cache_key)
@@ -1302,6 +1549,60 @@ class MarketDataClient:
 		self.fx_cache.set(cache_key, rate, ttl_seconds=self.fx_ttl_seconds)
 		return rate, []
 
+	async def fetch_fx_rates(
+		self,
+		currency_pairs: Iterable[tuple[str, str]],
+		*,
+		prefer_stale: bool = False,
+		schedule_stale_refresh: bool = True,
+		concurrency: int | None = None,
+	) -> tuple[dict[tuple[str, str], float], list[str]]:
+		"""Fetch many FX rates at once by overlapping the per-pair requests.
+
+		The FX providers expose no multi-pair endpoint, so unique pairs are
+		fetched concurrently instead. Returns rates keyed by the input pairs
+		plus warnings for the pairs that failed, which are omitted from the
+		result.
+		"""
+		unique_pairs = list(dict.fromkeys(currency_pairs))
+		semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+
+		async def fetch_single(
+			pair: tuple[str, str],
+		) -> tuple[tuple[str, str], float | None, list[str]]:
+			from_currency, to_currency = pair
+			try:
+				if semaphore is None:
+					rate, rate_warnings = await self.fetch_fx_rate(
+						from_currency,
+						to_currency,
+						prefer_stale=prefer_stale,
+						schedule_stale_refresh=schedule_stale_refresh,
+					)
+				else:
+					async with semaphore:
+						rate, rate_warnings = await self.fetch_fx_rate(
+							from_currency,
+							to_currency,
+							prefer_stale=prefer_stale,
+							schedule_stale_refresh=schedule_stale_refresh,
+						)
+			except (QuoteLookupError, ValueError) as exc:
+				return pair, None, [
+					f"{from_currency.strip().upper()}/{to_currency.strip().upper()} 汇率拉取失败: {exc}",
+				]
+			return pair, rate, rate_warnings
+
+		rates: dict[tuple[str, str], float] = {}
+		warnings: list[str] = []
+		for pair, rate, pair_warnings in await asyncio.gather(
+			*(fetch_single(pair) for pair in unique_pairs),
+		):
+			warnings.extend(pair_warnings)
+			if rate is not None:
+				rates[pair] = rate
+		return rates, warnings
+
 	async def fetch_hourly_price_series(
 		self,
 		symbol: str,
@@ -1340,14 +1641,14 @@ class MarketDataClient:
 				"includePrePost": "false",
 			}
 			try:
-				async with httpx.AsyncClient(timeout=15.0) as client:
-					response = await client.get(
-						url,
-						params=params,
-						headers={"User-Agent": "Mozilla/5.0"},
-					)
-					response.raise_for_status()
-					payload = response.json()
+				response = await self.quote_provider._get_client().get(
+					url,
+					params=params,
+					headers={"User-Agent": "Mozilla/5.0"},
+					timeout=15.0,
+				)
+				response.raise_for_status()
+				payload = orjson.loads(response.content)
 			except httpx.HTTPError as exc:
 				return [], None, f"{normalized_symbol} {interval} 历史行情拉取失败: {exc}"
 
@@ -1427,24 +1728,55 @@ class MarketDataClient:
 		if cached_results is not None:
 			return cached_results
 
+		inflight_search = self._search_inflight.get(cache_key)
+		if inflight_search is not None:
+			return await asyncio.shield(inflight_search)
+
+		inflight_future: asyncio.Future[list[SecuritySearchResult]] = (
+			asyncio.get_running_loop().create_future()
+		)
+		self._search_inflight[cache_key] = inflight_future
+		try:
+			results = await self._search_securities_uncached(normalized_query)
+		except BaseException as exc:
+			inflight_future.set_exception(exc)
+			inflight_future.exception()
+			raise
+		else:
+			inflight_future.set_result(results)
+			self.search_cache.set(cache_key, results, ttl_seconds=self.search_ttl_seconds)
+			return results
+		finally:
+			self._search_inflight.pop(cache_key, None)
+
+	async def _search_securities_uncached(self, normalized_query: str) -> list[SecuritySearchResult]:
 		local_results = build_local_search_results(normalized_query)
-		china_results: list[SecuritySearchResult] = []
 		global_results: list[SecuritySearchResult] = []
 		should_query_global_provider = not local_results and not _contains_cjk_characters(
 			normalized_query,
 		)
 
-		try:
-			china_results = await self.china_search_provider.search(normalized_query)
-		except QuoteLookupError:
-			china_results = []
-
+		# The providers are independent network calls; when both run, overlap
+		# them instead of serializing the round-trips.
 		if should_query_global_provider:
-			try:
-				global_results = await self.search_provider.search(normalized_query)
-			except QuoteLookupError:
-				global_results = []
+			china_results, global_results = await asyncio.gather(
+				self._search_one_provider(self.china_search_provider, normalized_query),
+				self._search_one_provider(self.search_provider, normalized_query),
+			)
+		else:
+			china_results = await self._search_one_provider(
+				self.china_search_provider,
+				normalized_query,
+			)
 
-		results = _merge_search_results(local_results, _merge_search_results(china_results, global_results))
-		self.search_cache.set(cache_key, results, ttl_seconds=self.search_ttl_seconds)
-		return results
+		return _merge_search_results(local_results, china_results, global_results)
+
+	@staticmethod
+	async def _search_one_provider(
+		provider: EastMoneySecuritySearchProvider | YahooSecuritySearchProvider,
+		normalized_query: str,
+	) -> list[SecuritySearchResult]:
+		try:
+			return await provider.search(normalized_query)
+		except QuoteLookupError:
+			return []
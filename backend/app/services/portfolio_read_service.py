@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterable
 from decimal import Decimal
 
 from app.models import (
@@ -86,6 +87,47 @@ async def _load_display_fx_rates(
 
 	return rates, usd_cny_rate, hkd_cny_rate, warnings
 
+
+async def _prefetch_cny_rates(
+	currency_codes: Iterable[str],
+	fx_rate_overrides: dict[str, Decimal] | None = None,
+	*,
+	prefer_stale_market_data: bool = False,
+) -> tuple[dict[str, Decimal], dict[str, str], list[str]]:
+	"""Fetch CNY rates for distinct currencies concurrently instead of per row."""
+	rates: dict[str, Decimal] = dict(fx_rate_overrides) if fx_rate_overrides else {}
+	rate_errors: dict[str, str] = {}
+	warnings: list[str] = []
+	pending_codes = sorted({code for code in currency_codes if code not in rates})
+
+	async def load_rate(currency_code: str) -> tuple[str, Decimal | None, list[str]]:
+		try:
+			if prefer_stale_market_data:
+				rate, rate_warnings = await service_context.market_data_client.fetch_fx_rate(
+					currency_code,
+					"CNY",
+					prefer_stale=True,
+					schedule_stale_refresh=False,
+				)
+			else:
+				rate, rate_warnings = await service_context.market_data_client.fetch_fx_rate(
+					currency_code,
+					"CNY",
+				)
+		except (QuoteLookupError, ValueError) as exc:
+			rate_errors[currency_code] = str(exc)
+			return currency_code, None, []
+		return currency_code, quantize_decimal(rate), rate_warnings
+
+	for currency_code, rate, rate_warnings in await asyncio.gather(
+		*(load_rate(currency_code) for currency_code in pending_codes),
+	):
+		warnings.extend(rate_warnings)
+		if rate is not None:
+			rates[currency_code] = rate
+
+	return rates, rate_errors, warnings
+
 async def _value_cash_accounts(
 	accounts: list[CashAccount],
 	fx_rate_overrides: dict[str, Decimal] | None = None,
@@ -95,37 +137,27 @@ async def _value_cash_accounts(
 	items: list[ValuedCashAccount] = []
 	total = DECIMAL_ZERO
 	warnings: list[str] = []
+	fetched_rates, rate_errors, fx_warnings = await _prefetch_cny_rates(
+		(_normalize_currency(account.currency) for account in accounts),
+		fx_rate_overrides,
+		prefer_stale_market_data=prefer_stale_market_data,
+	)
+	warnings.extend(fx_warnings)
 
 	for account in accounts:
 		currency_code = _normalize_currency(account.currency)
-		try:
-			override_rate = fx_rate_overrides.get(currency_code) if fx_rate_overrides else None
-			if override_rate is not None:
-				fx_rate = override_rate
-				fx_warnings: list[str] = []
-			else:
-				if prefer_stale_market_data:
-					fx_rate, fx_warnings = await service_context.market_data_client.fetch_fx_rate(
-						currency_code,
-						"CNY",
-						prefer_stale=True,
-						schedule_stale_refresh=False,
-					)
-				else:
-					fx_rate, fx_warnings = await service_context.market_data_client.fetch_fx_rate(
-						currency_code,
-						"CNY",
-					)
-			fx_rate = quantize_decimal(fx_rate)
+		fx_rate = fetched_rates.get(currency_code)
+		if fx_rate is not None:
 			value_cny = display_money(multiply_decimals(account.balance, fx_rate))
-			warnings.extend(fx_warnings)
-		except (QuoteLookupError, ValueError) as exc:
+		else:
 			fx_rate = DECIMAL_ZERO
 			value_cny = DECIMAL_ZERO
-			warnings.append(f"现金账户 {account.name} 换汇失败: {exc}")
+			warnings.append(
+				f"现金账户 {account.name} 换汇失败: {rate_errors.get(currency_code, '汇率不可用')}",
+			)
 
 		items.append(
-			ValuedCashAccount(
+			ValuedCashAccount.model_construct(
 				id=account.id or 0,
 				name=account.name,
 				platform=account.platform,
@@ -209,7 +241,7 @@ async def _value_holding(
 		warnings.append(f"持仓 {holding.symbol} 行情更新中")
 
 	return (
-			ValuedHolding(
+			ValuedHolding.model_construct(
 				id=holding.id or 0,
 				symbol=holding.symbol,
 				name=holding.name,
@@ -275,7 +307,7 @@ def _value_fixed_assets(
 	for asset in assets:
 		value_cny = display_money(asset.current_value_cny)
 		items.append(
-			ValuedFixedAsset(
+			ValuedFixedAsset.model_construct(
 				id=asset.id or 0,
 				name=asset.name,
 				category=asset.category,
@@ -302,37 +334,27 @@ async def _value_liabilities(
 	items: list[ValuedLiabilityEntry] = []
 	total = DECIMAL_ZERO
 	warnings: list[str] = []
+	fetched_rates, rate_errors, fx_warnings = await _prefetch_cny_rates(
+		(_normalize_currency(entry.currency) for entry in entries),
+		fx_rate_overrides,
+		prefer_stale_market_data=prefer_stale_market_data,
+	)
+	warnings.extend(fx_warnings)
 
 	for entry in entries:
 		currency_code = _normalize_currency(entry.currency)
-		try:
-			override_rate = fx_rate_overrides.get(currency_code) if fx_rate_overrides else None
-			if override_rate is not None:
-				fx_rate = override_rate
-				fx_warnings: list[str] = []
-			else:
-				if prefer_stale_market_data:
-					fx_rate, fx_warnings = await service_context.market_data_client.fetch_fx_rate(
-						currency_code,
-						"CNY",
-						prefer_stale=True,
-						schedule_stale_refresh=False,
-					)
-				else:
-					fx_rate, fx_warnings = await service_context.market_data_client.fetch_fx_rate(
-						currency_code,
-						"CNY",
-					)
-			fx_rate = quantize_decimal(fx_rate)
+		fx_rate = fetched_rates.get(currency_code)
+		if fx_rate is not None:
 			value_cny = display_money(multiply_decimals(entry.balance, fx_rate))
-			warnings.extend(fx_warnings)
-		except (QuoteLookupError, ValueError) as exc:
+		else:
 			fx_rate = DECIMAL_ZERO
 			value_cny = DECIMAL_ZERO
-			warnings.append(f"负债 {entry.name} 换汇失败: {exc}")
+			warnings.append(
+				f"负债 {entry.name} 换汇失败: {rate_errors.get(currency_code, '汇率不可用')}",
+			)
 
 		items.append(
-			ValuedLiabilityEntry(
+			ValuedLiabilityEntry.model_construct(
 				id=entry.id or 0,
 				name=entry.name,
 				category=entry.category,
@@ -357,7 +379,7 @@ def _value_other_assets(
 	for asset in assets:
 		value_cny = display_money(asset.current_value_cny)
 		items.append(
-			ValuedOtherAsset(
+			ValuedOtherAsset.model_construct(
 				id=asset.id or 0,
 				name=asset.name,
 				category=asset.category,
@@ -378,7 +400,7 @@ def _value_other_assets(
 def _to_cash_account_read(account: CashAccount) -> CashAccountRead:
 	valued_accounts, _, _warnings = asyncio.run(_value_cash_accounts([account]))
 	valued_account = valued_accounts[0] if valued_accounts else None
-	return CashAccountRead(
+	return CashAccountRead.model_construct(
 		id=account.id or 0,
 		name=account.name,
 		platform=account.platform,
@@ -424,7 +446,7 @@ def _to_cash_transfer_read(transfer: CashTransfer) -> CashTransferRead:
 def _to_holding_read(holding: SecurityHolding) -> SecurityHoldingRead:
 	valued_holdings, _, _warnings = asyncio.run(_value_holdings([holding]))
 	valued_holding = valued_holdings[0] if valued_holdings else None
-	return SecurityHoldingRead(
+	return SecurityHoldingRead.model_construct(
 		id=holding.id or 0,
 		symbol=holding.symbol,
 		name=holding.name,
@@ -9,17 +9,21 @@ from datetime import datetime, timedelta
 from time import monotonic
 from typing import TypeVar
 
-from sqlmodel import Session, select
+from sqlalchemy import delete
+from sqlmodel import Session, func, select
 
 from app import runtime_state
 from app.database import engine
+from app.analytics import bucket_start_utc
 from app.models import (
+	PORTFOLIO_ROLLUP_GRANULARITIES,
 	CashAccount,
 	FixedAsset,
 	HoldingPerformanceSnapshot,
 	LiabilityEntry,
 	OtherAsset,
 	PortfolioSnapshot,
+	PortfolioSnapshotRollup,
 	RealtimeHoldingPerformanceSnapshot,
 	RealtimePortfolioSnapshot,
 	SecurityHolding,
@@ -43,7 +47,7 @@ from app.services.common_service import (
 	_is_current_second,
 	_normalize_currency,
 )
-from app.services.market_data import Quote, QuoteLookupError
+from app.services.market_data import Quote
 
 REALTIME_SERIES_RETENTION = timedelta(hours=1, minutes=5)
 REALTIME_SAMPLER_INTERVAL_SECONDS = 1.0
@@ -71,15 +75,28 @@ def _group_by_user_id(
 	return grouped
 
 
+def _sum_cny_values_by_user(
+	session: Session,
+	user_id_column,
+	value_column,
+) -> dict[str, Decimal]:
+	return {
+		user_id: quantize_decimal(total)
+		for user_id, total in session.exec(
+			select(user_id_column, func.sum(value_column)).group_by(user_id_column),
+		)
+	}
+
+
 def _load_assets_for_all_users(
 	session: Session,
 ) -> tuple[
 	list[str],
 	dict[str, list[CashAccount]],
 	dict[str, list[SecurityHolding]],
-	dict[str, list[FixedAsset]],
+	dict[str, Decimal],
 	dict[str, list[LiabilityEntry]],
-	dict[str, list[OtherAsset]],
+	dict[str, Decimal],
 ]:
 	accounts = list(
 		session.exec(
@@ -93,43 +110,42 @@ def _load_assets_for_all_users(
 			.order_by(SecurityHolding.user_id.asc(), SecurityHolding.symbol.asc(), SecurityHolding.id.asc()),
 		),
 	)
-	fixed_assets = list(
-		session.exec(
-			select(FixedAsset)
-			.order_by(FixedAsset.user_id.asc(), FixedAsset.id.asc()),
-		),
-	)
 	liabilities = list(
 		session.exec(
 			select(LiabilityEntry)
 			.order_by(LiabilityEntry.user_id.asc(), LiabilityEntry.id.asc()),
 		),
 	)
-	other_assets = list(
-		session.exec(
-			select(OtherAsset)
-			.order_by(OtherAsset.user_id.asc(), OtherAsset.id.asc()),
-		),
+	# Fixed and other assets are stored directly in CNY and the sampler only
+	# needs their per-user totals, so sum them in the database instead of
+	# materializing every row.
+	fixed_asset_totals_by_user = _sum_cny_values_by_user(
+		session,
+		FixedAsset.user_id,
+		FixedAsset.current_value_cny,
+	)
+	other_asset_totals_by_user = _sum_cny_values_by_user(
+		session,
+		OtherAsset.user_id,
+		OtherAsset.current_value_cny,
 	)
 	accounts_by_user = _group_by_user_id(accounts, lambda item: item.user_id)
 	holdings_by_user = _group_by_user_id(holdings, lambda item: item.user_id)
-	fixed_assets_by_user = _group_by_user_id(fixed_assets, lambda item: item.user_id)
 	liabilities_by_user = _group_by_user_id(liabilities, lambda item: item.user_id)
-	other_assets_by_user = _group_by_user_id(other_assets, lambda item: item.user_id)
 	user_ids = sorted({
 		*accounts_by_user.keys(),
 		*holdings_by_user.keys(),
-		*fixed_assets_by_user.keys(),
+		*fixed_asset_totals_by_user.keys(),
 		*liabilities_by_user.keys(),
-		*other_assets_by_user.keys(),
+		*other_asset_totals_by_user.keys(),
 	})
 	return (
 		user_ids,
 		accounts_by_user,
 		holdings_by_user,
-		fixed_assets_by_user,
+		fixed_asset_totals_by_user,
 		liabilities_by_user,
-		other_assets_by_user,
+		other_asset_totals_by_user,
 	)
 
 
@@ -142,30 +158,16 @@ async def _prefetch_quotes(
 	}
 	if not unique_pairs:
 		return {}
-	semaphore = asyncio.Semaphore(REALTIME_MARKET_DATA_CONCURRENCY)
-
-	async def load_quote(symbol: str, market: str) -> tuple[tuple[str, str], Quote | None]:
-		async with semaphore:
-			try:
-				quote, _warnings = await service_context.market_data_client.fetch_quote(symbol, market)
-			except QuoteLookupError as exc:
-				service_context.logger.warning(
-					"Realtime analytics sampler could not load quote for %s (%s): %s",
-					symbol,
-					market,
-					exc,
-				)
-				return (symbol, market), None
-			return (symbol, market), quote
-
-	quote_results = await asyncio.gather(
-		*(load_quote(symbol, market) for symbol, market in sorted(unique_pairs)),
+	quotes, warnings = await service_context.market_data_client.fetch_quotes(
+		sorted(unique_pairs),
+		concurrency=REALTIME_MARKET_DATA_CONCURRENCY,
 	)
-	return {
-		pair: quote
-		for pair, quote in quote_results
-		if quote is not None
-	}
+	for warning in warnings:
+		service_context.logger.warning(
+			"Realtime analytics sampler could not load quote: %s",
+			warning,
+		)
+	return quotes
 
 
 async def _prefetch_fx_rates(
@@ -180,29 +182,19 @@ async def _prefetch_fx_rates(
 	requested_codes = sorted(code for code in normalized_codes if code != "CNY")
 	if not requested_codes:
 		return rates
-	semaphore = asyncio.Semaphore(REALTIME_MARKET_DATA_CONCURRENCY)
-
-	async def load_rate(currency_code: str) -> tuple[str, Decimal | None]:
-		async with semaphore:
-			try:
-				rate, _warnings = await service_context.market_data_client.fetch_fx_rate(
-					currency_code,
-					"CNY",
-				)
-			except (QuoteLookupError, ValueError) as exc:
-				service_context.logger.warning(
-					"Realtime analytics sampler could not load FX rate for %s/CNY: %s",
-					currency_code,
-					exc,
-				)
-				return currency_code, None
-			return currency_code, quantize_decimal(rate)
-
-	for currency_code, rate in await asyncio.gather(
-		*(load_rate(currency_code) for currency_code in requested_codes),
-	):
-		if rate is not None and rate > 0:
-			rates[currency_code] = rate
+	fetched_rates, warnings = await service_context.market_data_client.fetch_fx_rates(
+		[(currency_code, "CNY") for currency_code in requested_codes],
+		concurrency=REALTIME_MARKET_DATA_CONCURRENCY,
+	)
+	for warning in warnings:
+		service_context.logger.warning(
+			"Realtime analytics sampler could not load FX rate: %s",
+			warning,
+		)
+	for (currency_code, _to_code), rate in fetched_rates.items():
+		quantized_rate = quantize_decimal(rate)
+		if quantized_rate > 0:
+			rates[currency_code] = quantized_rate
 
 	return rates
 
@@ -212,13 +204,19 @@ def _build_user_realtime_state(
 	user_id: str,
 	accounts: list[CashAccount],
 	holdings: list[SecurityHolding],
-	fixed_assets: list[FixedAsset],
+	fixed_asset_total_cny: Decimal | None,
 	liabilities: list[LiabilityEntry],
-	other_assets: list[OtherAsset],
+	other_asset_total_cny: Decimal | None,
 	quotes_by_pair: dict[tuple[str, str], Quote],
 	fx_rates: dict[str, Decimal],
 ) -> UserRealtimeAnalyticsState:
-	has_assets = bool(accounts or holdings or fixed_assets or liabilities or other_assets)
+	has_assets = bool(
+		accounts
+		or holdings
+		or liabilities
+		or fixed_asset_total_cny is not None
+		or other_asset_total_cny is not None,
+	)
 	cash_total = sum(
 		(
 			display_money(
@@ -231,8 +229,8 @@ def _build_user_realtime_state(
 		),
 		DECIMAL_ZERO,
 	)
-	fixed_asset_total = sum((display_money(asset.current_value_cny) for asset in fixed_assets), DECIMAL_ZERO)
-	other_asset_total = sum((display_money(asset.current_value_cny) for asset in other_assets), DECIMAL_ZERO)
+	fixed_asset_total = display_money(fixed_asset_total_cny or DECIMAL_ZERO)
+	other_asset_total = display_money(other_asset_total_cny or DECIMAL_ZERO)
 	liability_total = sum(
 		(
 			display_money(
@@ -396,6 +394,51 @@ def _upsert_hourly_snapshots(
 				session.delete(snapshot)
 
 
+def _upsert_rollup_snapshots(
+	session: Session,
+	*,
+	user_states: list[UserRealtimeAnalyticsState],
+	hour_bucket: datetime,
+) -> None:
+	"""Keep the per-bucket portfolio rollups in step with the hourly snapshots.
+
+	The current hour is always the newest point in its day and month, so the
+	rollup row for each bucket simply tracks the latest sampled total.
+	"""
+	user_ids = [state.user_id for state in user_states]
+	if not user_ids:
+		return
+
+	for granularity in PORTFOLIO_ROLLUP_GRANULARITIES:
+		bucket = bucket_start_utc(hour_bucket, granularity)
+		existing_rollups = {
+			rollup.user_id: rollup
+			for rollup in session.exec(
+				select(PortfolioSnapshotRollup)
+				.where(PortfolioSnapshotRollup.user_id.in_(user_ids))
+				.where(PortfolioSnapshotRollup.granularity == granularity)
+				.where(PortfolioSnapshotRollup.bucket_start_utc == bucket),
+			)
+		}
+		for state in user_states:
+			rollup = existing_rollups.get(state.user_id)
+			if state.has_assets:
+				if rollup is None:
+					session.add(
+						PortfolioSnapshotRollup(
+							user_id=state.user_id,
+							granularity=granularity,
+							bucket_start_utc=bucket,
+							total_value_cny=state.total_value_cny,
+						),
+					)
+				else:
+					rollup.total_value_cny = state.total_value_cny
+					session.add(rollup)
+			elif rollup is not None:
+				session.delete(rollup)
+
+
 def _upsert_realtime_snapshots(
 	session: Session,
 	*,
@@ -497,16 +540,16 @@ def _purge_expired_realtime_snapshots(
 	now: datetime,
 ) -> None:
 	cutoff = _coerce_utc_datetime(now) - REALTIME_SERIES_RETENTION
-	for snapshot in session.exec(
-		select(RealtimePortfolioSnapshot).where(RealtimePortfolioSnapshot.created_at < cutoff),
-	):
-		session.delete(snapshot)
-	for snapshot in session.exec(
-		select(RealtimeHoldingPerformanceSnapshot).where(
+	# Bulk range deletes so the sampler drops the expired window in two
+	# statements instead of materializing every expired row as an ORM object.
+	session.execute(
+		delete(RealtimePortfolioSnapshot).where(RealtimePortfolioSnapshot.created_at < cutoff),
+	)
+	session.execute(
+		delete(RealtimeHoldingPerformanceSnapshot).where(
 			RealtimeHoldingPerformanceSnapshot.created_at < cutoff,
 		),
-	):
-		session.delete(snapshot)
+	)
 
 
 async def _sample_realtime_analytics_once_with_session(
@@ -520,9 +563,9 @@ async def _sample_realtime_analytics_once_with_session(
 		user_ids,
 		accounts_by_user,
 		holdings_by_user,
-		fixed_assets_by_user,
+		fixed_asset_totals_by_user,
 		liabilities_by_user,
-		other_assets_by_user,
+		other_asset_totals_by_user,
 	) = _load_assets_for_all_users(session)
 	if not user_ids:
 		if second_bucket.second == 0:
@@ -544,9 +587,9 @@ async def _sample_realtime_analytics_once_with_session(
 			user_id=user_id,
 			accounts=accounts_by_user.get(user_id, []),
 			holdings=holdings_by_user.get(user_id, []),
-			fixed_assets=fixed_assets_by_user.get(user_id, []),
+			fixed_asset_total_cny=fixed_asset_totals_by_user.get(user_id),
 			liabilities=liabilities_by_user.get(user_id, []),
-			other_assets=other_assets_by_user.get(user_id, []),
+			other_asset_total_cny=other_asset_totals_by_user.get(user_id),
 			quotes_by_pair=quotes_by_pair,
 			fx_rates=fx_rates,
 		)
@@ -558,6 +601,11 @@ async def _sample_realtime_analytics_once_with_session(
 		user_states=user_states,
 		hour_bucket=hour_bucket,
 	)
+	_upsert_rollup_snapshots(
+		session,
+		user_states=user_states,
+		hour_bucket=hour_bucket,
+	)
 	_upsert_realtime_snapshots(
 		session,
 		user_states=user_states,
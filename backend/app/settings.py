@@ -1,4 +1,4 @@
-from functools import lru_cache
+from functools import cached_property, lru_cache
 import secrets
 from urllib.parse import urlparse
 
@@ -128,13 +128,19 @@ class Settings(BaseSettings):
 
 		return _unique(derived_hosts or LOCAL_HOSTS.copy())
 
+	@cached_property
+	def _allowed_origin_set(self) -> frozenset[str]:
+		# Origin checks run on every browser request; normalize the configured
+		# origins once instead of re-splitting the CSV per call.
+		return frozenset(self.cors_origins())
+
 	def is_allowed_origin(self, origin: str) -> bool:
 		try:
 			normalized_origin = _normalize_origin(origin)
 		except ValueError:
 			return False
 
-		return normalized_origin in self.cors_origins()
+		return normalized_origin in self._allowed_origin_set
 
 	def session_cookie_https_only(self) -> bool:
 		origins = self.cors_origins()
@@ -45,6 +45,7 @@ EXPECTED_API_ROUTE_METHODS = {
 	("PATCH", "/api/cash-transfers/{transfer_id}"),
 	("PATCH", "/api/holding-transactions/{transaction_id}"),
 	("POST", "/api/accounts"),
+	("POST", "/api/accounts/bulk"),
 	("POST", "/api/agent/tokens/issue"),
 	("POST", "/api/admin/feedback/{feedback_id}/ack"),
 	("POST", "/api/admin/feedback/{feedback_id}/classify"),
@@ -88,7 +89,7 @@ def test_api_route_contract_is_stable() -> None:
 	}
 
 	assert actual_routes == EXPECTED_API_ROUTE_METHODS
-	assert len(actual_routes) == 74
+	assert len(actual_routes) == 75
 
 
 def test_openapi_paths_match_route_contract() -> None:
@@ -1,5 +1,5 @@
 import asyncio
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
 import threading
@@ -128,6 +128,28 @@ class StaticMarketDataClient:
 			return 1.0, []
 		return 7.0, []
 
+	async def fetch_fx_rates(
+		self,
+		currency_pairs: Iterable[tuple[str, str]],
+		*,
+		prefer_stale: bool = False,
+		schedule_stale_refresh: bool = True,
+		concurrency: int | None = None,
+	) -> tuple[dict[tuple[str, str], float], list[str]]:
+		del concurrency
+		rates: dict[tuple[str, str], float] = {}
+		warnings: list[str] = []
+		for pair in dict.fromkeys(currency_pairs):
+			rate, rate_warnings = await self.fetch_fx_rate(
+				pair[0],
+				pair[1],
+				prefer_stale=prefer_stale,
+				schedule_stale_refresh=schedule_stale_refresh,
+			)
+			rates[pair] = rate
+			warnings.extend(rate_warnings)
+		return rates, warnings
+
 	async def fetch_hourly_price_series(
 		self,
 		symbol: str,
@@ -158,6 +180,21 @@ class StaticMarketDataClient:
 			[],
 		)
 
+	async def fetch_quotes(
+		self,
+		symbol_market_pairs: Iterable[tuple[str, str | None]],
+		*,
+		concurrency: int | None = None,
+	) -> tuple[dict[tuple[str, str | None], Quote], list[str]]:
+		del concurrency
+		quotes: dict[tuple[str, str | None], Quote] = {}
+		warnings: list[str] = []
+		for pair in dict.fromkeys(symbol_market_pairs):
+			quote, quote_warnings = await self.fetch_quote(pair[0], pair[1])
+			quotes[pair] = quote
+			warnings.extend(quote_warnings)
+		return quotes, warnings
+
 	def clear_runtime_caches(self, *, clear_search: bool = False) -> None:
 		return None
 
@@ -109,6 +109,21 @@ class DeferredRateProvider:
 		self._refresh_gate.set()
 
 
+class DeferredSearchProvider:
+	def __init__(self, results: list[SecuritySearchResult]) -> None:
+		self._results = results
+		self._search_gate = asyncio.Event()
+		self.calls = 0
+
+	async def search(self, query: str) -> list[SecuritySearchResult]:
+		self.calls += 1
+		await self._search_gate.wait()
+		return self._results
+
+	def release_search(self) -> None:
+		self._search_gate.set()
+
+
 class SequenceSearchProvider:
 	def __init__(self, outcomes: list[object]) -> None:
 		self._outcomes = outcomes
@@ -595,6 +610,40 @@ def test_search_securities_uses_cache_before_calling_provider() -> None:
 	assert provider.queries == ["bad symbol!"]
 
 
+def test_search_securities_deduplicates_concurrent_lookups() -> None:
+	results = [
+		SecuritySearchResult(
+			symbol="600519.SS",
+			name="贵州茅台",
+			market="CN",
+			currency="CNY",
+			exchange="SHH",
+		),
+	]
+
+	async def scenario() -> None:
+		china_provider = DeferredSearchProvider(results)
+		global_provider = SequenceSearchProvider([[]])
+		client = MarketDataClient(
+			china_search_provider=china_provider,
+			search_provider=global_provider,
+		)
+
+		first_task = asyncio.create_task(client.search_securities("zzz corp"))
+		second_task = asyncio.create_task(client.search_securities("ZZZ Corp"))
+		await asyncio.sleep(0)
+
+		china_provider.release_search()
+		first_results, second_results = await asyncio.gather(first_task, second_task)
+
+		assert first_results == results
+		assert second_results == results
+		assert china_provider.calls == 1
+		assert global_provider.calls == 1
+
+	asyncio.run(scenario())
+
+
 def test_search_securities_returns_local_alias_when_provider_fails() -> None:
 	client = MarketDataClient(
 		china_search_provider=SequenceSearchProvider([[]]),